@@ -0,0 +1,56 @@
+"""
+Synthetic puzzle input generators.
+
+Every solved day has a module dayNN.py with generate(<size>, seed), taking
+the natural size of that puzzle (number of lines, grid side, number of
+robots, ...), and scaled(scale, seed), which scales the real puzzle input
+size so that the input grows roughly linearly with scale.
+"""
+import importlib
+import math
+import os
+import pkgutil
+import re
+from typing import Dict
+
+def discover_generators() -> Dict[int, str]:
+    """Return a dictionary mapping day number to generator module name."""
+    days = {}
+    for module_info in pkgutil.iter_modules(__path__):
+        match = re.fullmatch(r'day(\d+)', module_info.name)
+        if match:
+            days[int(match.group(1))] = module_info.name
+    return dict(sorted(days.items()))
+
+def is_scalable(day: int) -> bool:
+    """
+    Check if the solution of a day uses the full generated input.
+
+    Generators of days whose solutions work on a fixed size (like the 71x71
+    memory space of day 18) set FIXED_SIZE = True; their inputs do not
+    grow the work with scale, so they are left out of scaling runs.
+    """
+    module = importlib.import_module(f'{__name__}.{discover_generators()[day]}')
+    return not getattr(module, 'FIXED_SIZE', False)
+
+def scaled_side(base_side: int, scale: float) -> int:
+    """Grid side for which the number of cells grows linearly with scale."""
+    return max(3, round(base_side * math.sqrt(scale)))
+
+def generate_input(day: int, scale: float = 1, seed: int = 0) -> str:
+    """Generate an input for given day, scale times the size of the real input."""
+    module = importlib.import_module(f'{__name__}.{discover_generators()[day]}')
+    return module.scaled(scale, seed)
+
+def write_input(day: int, directory: str, scale: float = 1, seed: int = 0) -> str:
+    """
+    Generate an input for given day and write it to directory.
+
+    Returns:
+        Path of the written file, named like 7-x10.txt
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'{day}-x{scale:g}.txt')
+    with open(path, 'w') as file:
+        file.write(generate_input(day, scale, seed))
+    return path
@@ -0,0 +1,13 @@
+import random
+
+BASE_LINES = 1000
+
+def generate(lines: int, seed: int = 0) -> str:
+    """Two columns of 5-digit location ids, with repeats for part 2."""
+    rng = random.Random(seed)
+    ids = [rng.randint(10000, 99999) for _ in range(max(1, lines // 4))]
+    rows = [f"{rng.randint(10000, 99999)}   {rng.choice(ids)}" for _ in range(lines)]
+    return '\n'.join(rows) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_LINES * scale), seed)
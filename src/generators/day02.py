@@ -0,0 +1,21 @@
+import random
+
+BASE_REPORTS = 1000
+
+def generate(reports: int, seed: int = 0) -> str:
+    """Reports of 5-8 levels; most are monotonic with small steps and some get a bad level."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(reports):
+        length = rng.randint(5, 8)
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(10, 90)]
+        for _ in range(length - 1):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+        if rng.random() < 0.6:
+            levels[rng.randrange(length)] += rng.choice((-4, -1, 0, 1, 4))
+        rows.append(' '.join(map(str, levels)))
+    return '\n'.join(rows) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_REPORTS * scale), seed)
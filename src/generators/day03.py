@@ -0,0 +1,28 @@
+import random
+
+BASE_LENGTH = 18000
+
+NOISE = ["who()", "what()", "select()", "from()", "where()", "how()", "when()", "mul[3,7]",
+         "mul(32,64]", "mul ( 2 , 4 )", "mul(1234,5)", "do_not", "don't", "%", "&", "^", "+", "'", "]"]
+
+def generate(length: int, seed: int = 0) -> str:
+    """Corrupted memory of about length characters with mul(X,Y), do() and don't() tokens."""
+    rng = random.Random(seed)
+    tokens = []
+    size = 0
+    while size < length:
+        roll = rng.random()
+        if roll < 0.35:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.38:
+            token = "do()"
+        elif roll < 0.41:
+            token = "don't()"
+        else:
+            token = rng.choice(NOISE)
+        tokens.append(token)
+        size += len(token)
+    return ''.join(tokens) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_LENGTH * scale), seed)
@@ -0,0 +1,13 @@
+import random
+from src.generators import scaled_side
+
+BASE_SIDE = 140
+
+def generate(side: int, seed: int = 0) -> str:
+    """Square grid of X, M, A, S letters."""
+    rng = random.Random(seed)
+    rows = [''.join(rng.choice('XMAS') for _ in range(side)) for _ in range(side)]
+    return '\n'.join(rows) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(scaled_side(BASE_SIDE, scale), seed)
@@ -0,0 +1,25 @@
+import random
+
+BASE_UPDATES = 200
+
+def generate(updates: int, seed: int = 0, pages: int = 49) -> str:
+    """
+    Ordering rules for every pair of pages (a random total order), followed
+    by updates of 5-23 distinct pages of which about half are correctly ordered.
+    """
+    rng = random.Random(seed)
+    order = rng.sample(range(10, 100), pages)
+    rules = [f"{order[i]}|{order[j]}" for i in range(pages) for j in range(i + 1, pages)]
+    rng.shuffle(rules)
+
+    rank = {page: index for index, page in enumerate(order)}
+    lines = []
+    for _ in range(updates):
+        update = rng.sample(order, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.get)
+        lines.append(','.join(map(str, update)))
+    return '\n'.join(rules) + '\n\n' + '\n'.join(lines) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_UPDATES * scale), seed)
@@ -0,0 +1,41 @@
+import random
+from src.generators import scaled_side
+
+BASE_SIDE = 130
+
+# Direction vectors for UP, RIGHT, DOWN, LEFT (in clockwise order)
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+def guard_leaves(grid: list, row: int, col: int) -> bool:
+    """Check that the guard starting at (row, col) facing up walks off the map."""
+    side = len(grid)
+    direction = 0
+    seen = set()
+    while (row, col, direction) not in seen:
+        seen.add((row, col, direction))
+        dy, dx = DIRECTIONS[direction]
+        if not (0 <= row + dy < side and 0 <= col + dx < side):
+            return True
+        if grid[row + dy][col + dx] == '#':
+            direction = (direction + 1) % 4
+        else:
+            row, col = row + dy, col + dx
+    return False
+
+def generate(side: int, seed: int = 0, density: float = 0.05) -> str:
+    """
+    Lab map with randomly placed obstacles and the guard '^' near the middle.
+
+    Maps where the guard walks in a loop are not valid puzzle inputs, so
+    they are drawn again until the guard leaves the map.
+    """
+    rng = random.Random(seed)
+    while True:
+        grid = [['#' if rng.random() < density else '.' for _ in range(side)] for _ in range(side)]
+        row, col = rng.randint(side // 4, 3 * side // 4), rng.randint(side // 4, 3 * side // 4)
+        grid[row][col] = '^'
+        if guard_leaves(grid, row, col):
+            return '\n'.join(''.join(line) for line in grid) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(scaled_side(BASE_SIDE, scale), seed)
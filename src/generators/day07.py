@@ -0,0 +1,26 @@
+import random
+
+BASE_EQUATIONS = 850
+
+def generate(equations: int, seed: int = 0) -> str:
+    """Equations of 2-12 numbers; about half have a target reachable with +, * and ||."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(equations):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice('+*|')
+            if op == '+':
+                target += number
+            elif op == '*':
+                target *= number
+            else:
+                target = int(f"{target}{number}")
+        if rng.random() < 0.5:
+            target += rng.randint(1, 9)
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return '\n'.join(lines) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_EQUATIONS * scale), seed)
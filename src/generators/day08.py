@@ -0,0 +1,18 @@
+import random
+import string
+from src.generators import scaled_side
+
+BASE_SIDE = 50
+
+FREQUENCIES = string.digits + string.ascii_letters
+
+def generate(side: int, seed: int = 0) -> str:
+    """Antenna map with about one antenna per 12 cells spread over the frequencies."""
+    rng = random.Random(seed)
+    grid = [['.'] * side for _ in range(side)]
+    for _ in range(side * side // 12):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(FREQUENCIES)
+    return '\n'.join(''.join(line) for line in grid) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(scaled_side(BASE_SIDE, scale), seed)
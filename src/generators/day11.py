@@ -0,0 +1,11 @@
+import random
+
+BASE_STONES = 8
+
+def generate(stones: int, seed: int = 0) -> str:
+    """A single line of stone numbers."""
+    rng = random.Random(seed)
+    return ' '.join(str(rng.choice((0, rng.randint(1, 9999999)))) for _ in range(stones)) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(max(1, round(BASE_STONES * scale)), seed)
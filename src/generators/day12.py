@@ -0,0 +1,24 @@
+import random
+import string
+from src.generators import scaled_side
+
+BASE_SIDE = 140
+
+def generate(side: int, seed: int = 0, block: int = 6) -> str:
+    """Garden of plant regions: a coarse random plot map, upscaled and partly scrambled."""
+    rng = random.Random(seed)
+    coarse_side = side // block + 1
+    coarse = [[rng.choice(string.ascii_uppercase) for _ in range(coarse_side)] for _ in range(coarse_side)]
+    rows = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            if rng.random() < 0.1:
+                row.append(rng.choice(string.ascii_uppercase))
+            else:
+                row.append(coarse[y // block][x // block])
+        rows.append(''.join(row))
+    return '\n'.join(rows) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(scaled_side(BASE_SIDE, scale), seed)
@@ -0,0 +1,20 @@
+import random
+
+BASE_MACHINES = 320
+
+def generate(machines: int, seed: int = 0) -> str:
+    """Claw machines; about a third have prizes reachable with whole button presses."""
+    rng = random.Random(seed)
+    blocks = []
+    for _ in range(machines):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.35:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        blocks.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}")
+    return '\n\n'.join(blocks) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_MACHINES * scale), seed)
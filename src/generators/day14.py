@@ -0,0 +1,36 @@
+import random
+
+BASE_ROBOTS = 500
+
+def generate(robots: int, seed: int = 0, width: int = 101, height: int = 103,
+             tree_fraction: float = 0.6) -> str:
+    """
+    Robots with random positions and velocities on the width x height floor.
+
+    A tree_fraction of the robots is placed so that they gather in a
+    triangle near the middle at one moment below 10000 seconds, which gives
+    part 2 a pattern to find.
+    """
+    rng = random.Random(seed)
+    moment = rng.randrange(1, 10000)
+    tree_height = min(33, height // 2, width // 2)
+    # Near the middle, so that the gathered robots stand out from the spread of the others
+    top_x = width // 2 + rng.randint(-width // 10, width // 10)
+    top_y = (height - tree_height) // 2 + rng.randint(-height // 10, height // 10)
+
+    lines = []
+    for index in range(robots):
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        if index < robots * tree_fraction:
+            # Position inside the triangle at the moment, traced back to time 0
+            dy = rng.randrange(tree_height)
+            x, y = top_x + rng.randint(-(dy // 2), dy // 2), top_y + dy
+            x, y = (x - vx * moment) % width, (y - vy * moment) % height
+        else:
+            x, y = rng.randrange(width), rng.randrange(height)
+        lines.append(f"p={x},{y} v={vx},{vy}")
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_ROBOTS * scale), seed)
@@ -0,0 +1,22 @@
+import random
+from src.generators import scaled_side
+
+BASE_SIDE = 50
+BASE_MOVES = 20000
+
+def generate(side: int, moves: int, seed: int = 0) -> str:
+    """Walled warehouse with boxes, a few inner walls and the robot, followed by moves."""
+    rng = random.Random(seed)
+    grid = [['#'] * side for _ in range(side)]
+    for y in range(1, side - 1):
+        for x in range(1, side - 1):
+            roll = rng.random()
+            grid[y][x] = '#' if roll < 0.05 else 'O' if roll < 0.35 else '.'
+    grid[side // 2][side // 2] = '@'
+
+    commands = ''.join(rng.choice('<>^v') for _ in range(moves))
+    command_lines = [commands[i:i + 1000] for i in range(0, len(commands), 1000)]
+    return '\n'.join(''.join(row) for row in grid) + '\n\n' + '\n'.join(command_lines) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(scaled_side(BASE_SIDE, scale), round(BASE_MOVES * scale), seed)
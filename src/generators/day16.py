@@ -0,0 +1,43 @@
+import random
+from src.generators import scaled_side
+
+BASE_SIDE = 141
+
+def generate(side: int, seed: int = 0, loops: float = 0.05) -> str:
+    """
+    Walled corridor maze with S in the bottom-left and E in the top-right corner.
+
+    Corridors are carved with a randomised depth-first search on the odd
+    cells, then a fraction of the remaining inner walls is knocked out so
+    that there are several competing paths, as in the real puzzle.
+    """
+    rng = random.Random(seed)
+    side = side if side % 2 else side + 1
+    grid = [['#'] * side for _ in range(side)]
+
+    start = (side - 2, 1)
+    grid[start[0]][start[1]] = '.'
+    stack = [start]
+    while stack:
+        y, x = stack[-1]
+        neighbours = [(y + dy, x + dx, dy // 2, dx // 2) for dy, dx in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                      if 0 < y + dy < side - 1 and 0 < x + dx < side - 1 and grid[y + dy][x + dx] == '#']
+        if not neighbours:
+            stack.pop()
+            continue
+        ny, nx, dy, dx = rng.choice(neighbours)
+        grid[y + dy][x + dx] = '.'
+        grid[ny][nx] = '.'
+        stack.append((ny, nx))
+
+    for y in range(1, side - 1):
+        for x in range(1, side - 1):
+            if grid[y][x] == '#' and (y % 2 == 1 or x % 2 == 1) and rng.random() < loops:
+                grid[y][x] = '.'
+
+    grid[start[0]][start[1]] = 'S'
+    grid[1][side - 2] = 'E'
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(scaled_side(BASE_SIDE, scale), seed)
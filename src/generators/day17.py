@@ -0,0 +1,17 @@
+import random
+
+BASE_DIGITS = 16
+
+PROGRAM = "2,4,1,5,7,5,1,6,4,3,5,5,0,3,3,0"
+
+def generate(digits: int, seed: int = 0) -> str:
+    """
+    The puzzle program with a random register A of the given number of octal
+    digits; the program prints one value per digit.
+    """
+    rng = random.Random(seed)
+    a = rng.randrange(8 ** (digits - 1), 8 ** digits)
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {PROGRAM}\n"
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(max(1, round(BASE_DIGITS * scale)), seed)
@@ -0,0 +1,22 @@
+import random
+
+BASE_BYTES = 3450
+SIDE = 71
+# The solution always works on the 71x71 space (and the first 1024 bytes in
+# part 1), so larger inputs do not make it do more work
+FIXED_SIZE = True
+
+def generate(count: int, seed: int = 0) -> str:
+    """
+    Distinct falling byte positions on the 71x71 memory space.
+
+    The solution works on a fixed 71x71 grid, so count is capped at the
+    number of cells other than the start and the exit.
+    """
+    rng = random.Random(seed)
+    cells = [(x, y) for x in range(SIDE) for y in range(SIDE) if (x, y) not in ((0, 0), (SIDE - 1, SIDE - 1))]
+    positions = rng.sample(cells, min(count, len(cells)))
+    return '\n'.join(f"{x},{y}" for x, y in positions) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_BYTES * scale), seed)
@@ -0,0 +1,43 @@
+import random
+
+BASE_DESIGNS = 400
+BASE_PATTERNS = 447
+
+COLORS = 'wubrg'
+
+def towel(rng: random.Random, length: int, missing: str, follower: str) -> str:
+    """Random towel of about length stripes, where missing is always followed by follower."""
+    stripes = ''
+    while len(stripes) < length:
+        color = rng.choice(COLORS)
+        stripes += missing + follower if color == missing else color
+    # Do not cut a missing stripe from its follower
+    return stripes[:length + 1] if stripes[length - 1] == missing else stripes[:length]
+
+def generate(designs: int, seed: int = 0, patterns: int = BASE_PATTERNS) -> str:
+    """
+    Towel patterns of 1-8 stripes and designs of 40-60 stripes, most built from patterns.
+
+    As in the real input, one colour has no single-stripe towel, and
+    impossible designs fail at their first stripes: the colour only appears
+    followed by one fixed colour, and corrupted designs start with it,
+    mostly followed by another colour.
+    """
+    rng = random.Random(seed)
+    missing = rng.choice(COLORS)
+    follower = rng.choice(COLORS.replace(missing, ''))
+    towels = sorted({towel(rng, rng.randint(1, 8), missing, follower) for _ in range(patterns)})
+
+    lines = []
+    for _ in range(designs):
+        length = rng.randint(40, 60)
+        design = ''
+        while len(design) < length:
+            design += rng.choice(towels)
+        if rng.random() < 0.3:
+            design = missing + design[1:]
+        lines.append(design)
+    return ', '.join(towels) + '\n\n' + '\n'.join(lines) + '\n'
+
+def scaled(scale: float, seed: int = 0) -> str:
+    return generate(round(BASE_DESIGNS * scale), seed)
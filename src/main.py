@@ -1,44 +1,462 @@
-import importlib
+import argparse
+import copy
+import json
+import os
 import sys
-from typing import Optional
+import tempfile
+import time
+from typing import List, Optional
 
-def run_day(day: int, part: Optional[int] = None):
+# Add the project root directory to Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.utils.input_reader import InputSource, clear_cache, file_digest, input_path, set_disk_cache, set_input_dir
+from src.utils.solver import Solver, discover_days, find_solver, solvers_for
+from src.utils.verbosity import set_verbosity
+
+# Known correct answers, keyed on the SHA-256 of the input file
+ANSWERS_PATH = os.path.join(project_root, 'answers.json')
+
+def parse_days(spec: str, available: List[int]) -> List[int]:
+    """
+    Parse a day selection like 'all', '5', '1-7' or '1,3,5-7'.
+
+    Days without a solution module are dropped from ranges.
+    """
+    if spec == 'all':
+        return list(available)
+
+    days = set()
+    for part in spec.split(','):
+        if '-' in part:
+            start, end = part.split('-')
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(part))
+    return [day for day in sorted(days) if day in available]
+
+def benchmark_day(day: int, parts: List[int], source: Optional[InputSource] = None,
+                  variant: Optional[str] = None, fastest: bool = False) -> List[dict]:
+    """
+    Run the selected parts of a day and measure parsing and each part separately.
+
+    Args:
+        day: Day number
+        parts: Parts to run
+        source: Input file to use instead of the day's default input
+        variant: Name of the registered variant to run (default: the baseline)
+        fastest: Run every registered variant and keep the fastest one per part
+    """
+    if source is None:
+        source = day
+    if not os.path.exists(input_path(source)):
+        print(f"Skipping day {day}: input {input_path(source)} not found")
+        return []
+
+    # Parsed inputs of earlier days and inputs would count in this one's peak RSS
+    clear_cache()
+    solvers = solvers_for(day) if fastest else [find_solver(day, variant)]
+    rows = [row for solver in solvers for row in benchmark_solver(solver, day, parts, source)]
+    if not fastest:
+        return rows
+
+    best = {}
+    for row in rows:
+        current = best.get(row['part'])
+        if (current is None or (current['error'] and not row['error'])
+                or (not row['error'] and row['wall_s'] < current['wall_s'])):
+            best[row['part']] = row
+    return [best[part] for part in parts if part in best]
+
+def benchmark_solver(solver: Solver, day: int, parts: List[int], source: InputSource) -> List[dict]:
+    """
+    Measure one variant of a day: the input is parsed once (timed as parse_s)
+    and every part is timed on the parsed arguments. Parts of variants that
+    modify their input get their own copy, made outside the measurement.
+    """
+    from src.utils.benchmark import measure
+
+    parsed = measure(solver.parse, source)
+    rows = []
+    for part in parts:
+        solve = solver.part(part)
+        if solve is None:
+            continue
+        if parsed['error']:
+            row = {'result': None, 'error': f"parse: {parsed['error']}", 'wall_s': 0.0, 'cpu_s': 0.0,
+                   'peak_rss_mb': parsed['peak_rss_mb']}
+        else:
+            args = copy.deepcopy(parsed['result']) if solver.mutates_input else parsed['result']
+            row = measure(solve, *args)
+        if row['result'] is not None:
+            row['result'] = str(row['result'])
+        rows.append({'day': day, 'part': part, 'variant': solver.name, 'input': input_path(source),
+                     'parse_s': parsed['wall_s'], **row})
+    return rows
+
+def benchmark_parallel(days: List[int], parts: List[int], jobs: int, split_parts: bool = False,
+                       inputs: Optional[List[str]] = None, variant: Optional[str] = None,
+                       fastest: bool = False) -> List[dict]:
+    """
+    Benchmark days concurrently on a pool of worker processes.
+
+    Days are independent, so each one (or each part, with split_parts) is a
+    separate task. Results are returned in day/part order regardless of
+    which task finishes first.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    sources = inputs or [None]
+    if split_parts:
+        tasks = [(day, [part], source) for day in days for source in sources for part in parts]
+    else:
+        tasks = [(day, parts, source) for day in days for source in sources]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(benchmark_day, *task, variant, fastest) for task in tasks]
+        rows = [row for future in futures for row in future.result()]
+
+    # Tasks were submitted in output order, only the part split needs re-sorting
+    order = {source: index for index, source in enumerate(sources)}
+    return sorted(rows, key=lambda row: (row['day'], order.get(row['input'], 0), row['part']))
+
+def write_json(data, json_path: Optional[str]):
+    """Print data as JSON ('-') or write it to json_path."""
+    if json_path == '-':
+        print(json.dumps(data, indent=2))
+    elif json_path:
+        with open(json_path, 'w') as file:
+            json.dump(data, file, indent=2)
+        print(f"Results written to {json_path}")
+
+def run_scaling(days: List[int], parts: List[int], scales: List[float], seed: int = 0,
+                json_path: Optional[str] = None, variant: Optional[str] = None, fastest: bool = False):
+    """
+    Benchmark days on generated inputs of increasing size.
+
+    Inputs are written by src.generators, scale times the size of the real
+    puzzle input, and the growth of wall time is reported as the exponent k
+    of time ~ size^k. variant and fastest select the implementation as in
+    benchmark_day.
+    """
+    from src.generators import discover_generators, is_scalable, write_input
+    from src.utils.benchmark import format_table, scaling_exponent
+
+    generators = discover_generators()
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            if day not in generators:
+                print(f"Skipping day {day}: no input generator")
+                continue
+            if not is_scalable(day):
+                print(f"Skipping day {day}: the solution works on a fixed input size")
+                continue
+            for scale in scales:
+                path = write_input(day, directory, scale, seed)
+                for row in benchmark_day(day, parts, path, variant, fastest):
+                    rows.append({**row, 'scale': scale})
+
+    print(format_table(rows))
+
+    exponents = []
+    for day in days:
+        for part in parts:
+            runs = [row for row in rows if row['day'] == day and row['part'] == part and not row['error']]
+            if runs:
+                exponent = scaling_exponent([row['scale'] for row in runs], [row['wall_s'] for row in runs])
+                exponents.append({'day': day, 'part': part, 'exponent': exponent})
+
+    print(f"\n{'Day':>4} {'Part':>4} {'Exponent':>9}")
+    for entry in exponents:
+        print(f"{entry['day']:>4} {entry['part']:>4} {entry['exponent']:>9.2f}")
+
+    write_json({'runs': rows, 'exponents': exponents}, json_path)
+
+def load_answers() -> dict:
+    """Load the answer registry, mapping input digest to the day and its answers."""
+    if not os.path.exists(ANSWERS_PATH):
+        return {}
+    with open(ANSWERS_PATH) as file:
+        return json.load(file)
+
+def save_answers(answers: dict):
+    with open(ANSWERS_PATH, 'w') as file:
+        json.dump(answers, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+def run_verify(days: List[int], parts: List[int], inputs: Optional[List[str]] = None,
+               record: bool = False, json_path: Optional[str] = None) -> bool:
+    """
+    Run every implementation of each day and check its answers.
+
+    Answers are looked up in answers.json by the SHA-256 of the input, and
+    each registered variant's wall time is compared with the baseline (the
+    first variant). With record, answers missing from the registry are taken
+    from the first variant that produces one and saved.
+
+    Returns:
+        True if no implementation gave a wrong answer or raised
+    """
+    from src.utils.benchmark import format_verify_table
+
+    answers = load_answers()
+    rows = []
+    for day in days:
+        for source in inputs or [day]:
+            if not os.path.exists(input_path(source)):
+                print(f"Skipping day {day}: input {input_path(source)} not found")
+                continue
+            clear_cache()
+            digest = file_digest(input_path(source))
+            expected = answers.setdefault(digest, {'day': day})
+            baseline_times = {}
+
+            for solver in solvers_for(day):
+                for row in benchmark_solver(solver, day, parts, source):
+                    key = f"part{row['part']}"
+                    if row['error']:
+                        row['status'] = 'ERROR'
+                    elif key in expected:
+                        row['status'] = 'OK' if row['result'] == expected[key] else 'FAIL'
+                    else:
+                        row['status'] = 'NEW'
+                        if record:
+                            expected[key] = row['result']
+
+                    # The baseline is the first variant that solved the part
+                    if not row['error']:
+                        baseline_times.setdefault(row['part'], row['wall_s'])
+                    baseline = baseline_times.get(row['part'])
+                    if baseline and not row['error']:
+                        row['speedup'] = baseline / max(row['wall_s'], 1e-9)
+                    else:
+                        row['speedup'] = None
+                    rows.append(row)
+
+    print(format_verify_table(rows))
+
+    if record:
+        save_answers({digest: entry for digest, entry in answers.items() if len(entry) > 1})
+        print(f"Answers recorded in {ANSWERS_PATH}")
+    write_json(rows, json_path)
+
+    return all(row['status'] in ('OK', 'NEW') for row in rows)
+
+def run_profile(days: List[int], parts: List[int], inputs: Optional[List[str]] = None,
+                top: int = 20, profile_dir: Optional[str] = None, trace_hot: bool = False,
+                variant: Optional[str] = None):
+    """
+    Profile each selected part without modifying the solution modules.
+
+    By default the part runs under cProfile, a sorted top-N report is
+    printed and the raw stats are saved as dayNN-partP.prof in profile_dir.
+    With trace_hot, only functions from src.solutions are traced and their
+    call counts and cumulative times are reported instead.
+    """
+    from src.utils.profiling import HotTracer, profile_call
+
+    for day in days:
+        for source in inputs or [day]:
+            if not os.path.exists(input_path(source)):
+                print(f"Skipping day {day}: input {input_path(source)} not found")
+                continue
+            clear_cache()
+            solver = find_solver(day, variant)
+            parsed = solver.parse(source)
+            for part in parts:
+                solve = solver.part(part)
+                if solve is None:
+                    continue
+                args = copy.deepcopy(parsed) if solver.mutates_input else parsed
+                print(f"\n=== Day {day} part {part} ({os.path.basename(input_path(source))}) ===")
+
+                if trace_hot:
+                    with HotTracer() as tracer:
+                        result = solve(*args)
+                    print(f"Answer: {result}")
+                    print(tracer.report(top))
+                    continue
+
+                dump_path = None
+                if profile_dir:
+                    os.makedirs(profile_dir, exist_ok=True)
+                    dump_path = os.path.join(profile_dir, f'day{day:02d}-part{part}.prof')
+                result, report = profile_call(solve, *args, top=top, dump_path=dump_path)
+                print(f"Answer: {result}")
+                print(report)
+                if dump_path:
+                    print(f"Profile written to {dump_path}")
+
+def run_benchmark(days: List[int], parts: List[int], json_path: Optional[str] = None,
+                  jobs: int = 1, split_parts: bool = False, inputs: Optional[List[str]] = None,
+                  import_time: bool = False, variant: Optional[str] = None, fastest: bool = False):
+    """
+    Benchmark a list of days and report a table and, optionally, JSON.
+
+    With inputs, every day is run once per input file (all in this process,
+    so modules and their imports are loaded only once). With fastest, every
+    registered variant is run and the fastest is reported. With import_time,
+    the cost of importing each day's module in a fresh interpreter is added
+    to the rows as import_s, and its heaviest imports are listed.
+    """
+    from src.utils.benchmark import format_table, measure_import
+
+    if jobs > 1:
+        rows = benchmark_parallel(days, parts, jobs, split_parts, inputs, variant, fastest)
+    else:
+        rows = []
+        for day in days:
+            for source in inputs or [None]:
+                rows.extend(benchmark_day(day, parts, source, variant, fastest))
+
+    if import_time:
+        modules = discover_days()
+        imports = {day: measure_import(f'src.solutions.{modules[day]}', project_root) for day in days}
+        for row in rows:
+            row.update(imports[row['day']])
+
+    print(format_table(rows))
+
+    if import_time:
+        print(f"\n{'Day':>4} {'Import (s)':>10}  Heaviest imports")
+        for day, entry in imports.items():
+            heaviest = ', '.join(f"{name} {seconds:.3f}s" for name, seconds in entry['heaviest_imports'])
+            print(f"{day:>4} {entry['import_s']:>10.3f}  {heaviest}")
+
+    write_json(rows, json_path)
+
+def run_day(day: int, part: Optional[int] = None, variant: Optional[str] = None):
     """
     Run solutions for a specific day.
     If part is specified, run only that part. Otherwise, run both parts.
+
+    The input is parsed once and shared by both parts; the time spent
+    parsing and solving each part is printed with the answers.
     """
-    # Pad day number with leading zero if needed
-    day_str = str(day).zfill(2)
-    
-    try:
-        # Dynamically import the day's solution module
-        solution_module = importlib.import_module(f'src.solutions.day{day_str}')
-        
-        # Execute the main function
-        solution_module.main()
-        
-    except ImportError as e:
+    if day not in discover_days():
         print(f"No solution found for day {day}")
-        print(f"Error: {e}")
+        return
+
+    try:
+        solver = find_solver(day, variant)
+    except KeyError as e:
+        print(e.args[0])
+        return
+
+    start = time.perf_counter()
+    try:
+        args = solver.parse(day)
     except Exception as e:
         print(f"Error running day {day}: {str(e)}")
+        return
+    print(f"Parse: {time.perf_counter() - start:.3f}s ({solver.name})")
+
+    for number in [part] if part else [1, 2]:
+        solve = solver.part(number)
+        if solve is None:
+            continue
+        part_args = copy.deepcopy(args) if solver.mutates_input else args
+        start = time.perf_counter()
+        try:
+            result = solve(*part_args)
+        except Exception as e:
+            print(f"Error running day {day} part {number}: {str(e)}")
+            continue
+        print(f"Part {number}: {result} ({time.perf_counter() - start:.3f}s)")
 
 def main():
-    if len(sys.argv) < 2:
-        print("Please provide a day number to run")
-        print("Usage: python main.py <day_number>")
-        return
-    
-    try:
-        day = int(sys.argv[1])
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2024 solutions")
+    parser.add_argument('days', help="day number, range ('1-7'), list ('1,3,5-7') or 'all'")
+    parser.add_argument('--part', type=int, choices=[1, 2], help="benchmark only this part")
+    parser.add_argument('--json', metavar='PATH', help="write benchmark results as JSON ('-' for stdout)")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="benchmark days in parallel on N worker processes")
+    parser.add_argument('--split-parts', action='store_true',
+                        help="with --jobs, run the two parts of a day as separate tasks")
+    parser.add_argument('--input', action='append', metavar='PATH',
+                        help="benchmark on this input file instead of inputs/N.txt (repeatable)")
+    parser.add_argument('--input-dir', metavar='DIR',
+                        help="read N.txt inputs from DIR (same as setting AOC_INPUT_DIR)")
+    parser.add_argument('--variant', metavar='NAME',
+                        help="run this registered variant of the day instead of the baseline (e.g. day15_3)")
+    parser.add_argument('--fastest', action='store_true',
+                        help="benchmark every registered variant of each day and report the fastest")
+    parser.add_argument('--verify', action='store_true',
+                        help="run every implementation of each day and check answers against answers.json")
+    parser.add_argument('--record', action='store_true',
+                        help="with --verify, store answers that are not in answers.json yet")
+    parser.add_argument('--profile', action='store_true',
+                        help="run under cProfile, print the top functions and save dayNN-partP.prof files")
+    parser.add_argument('--trace-hot', action='store_true',
+                        help="report call counts and cumulative time of the solutions' own functions")
+    parser.add_argument('--top', type=int, default=20, metavar='N',
+                        help="number of functions in --profile / --trace-hot reports")
+    parser.add_argument('--profile-dir', default='.', metavar='DIR',
+                        help="where --profile writes .prof files (default: current directory)")
+    parser.add_argument('--import-time', action='store_true',
+                        help="also measure each day's module import time in a fresh interpreter")
+    parser.add_argument('--scale', metavar='S1,S2,...',
+                        help="benchmark on generated inputs of these sizes (e.g. 1,10,100) and report the scaling exponent")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for generated inputs")
+    parser.add_argument('--verbose', '-v', action='count', default=0,
+                        help="show the solutions' progress and debug output (quiet by default)")
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help="persist parsed inputs under DIR so repeated runs skip parsing")
+    args = parser.parse_args()
+
+    # Exported so that worker processes use the same level
+    os.environ['AOC_VERBOSE'] = str(args.verbose)
+    set_verbosity(args.verbose)
+    if args.cache_dir:
+        # Exported as well so that worker processes pick up the same cache
+        os.environ['AOC_CACHE_DIR'] = args.cache_dir
+        set_disk_cache(args.cache_dir)
+    if args.input_dir:
+        os.environ['AOC_INPUT_DIR'] = args.input_dir
+        set_input_dir(args.input_dir)
+
+    # A single day number keeps the classic behaviour of printing the answers
+    # (with timings) instead of a benchmark table
+    if (args.days.isdigit() and args.part is None and args.json is None
+            and args.jobs == 1 and args.input is None and args.scale is None and not args.verify
+            and not args.profile and not args.trace_hot and not args.import_time and not args.fastest):
+        day = int(args.days)
         if day < 1 or day > 25:
             print("Day must be between 1 and 25")
             return
-        
-        run_day(day)
-        
+        run_day(day, variant=args.variant)
+        return
+
+    try:
+        days = parse_days(args.days, list(discover_days()))
     except ValueError:
-        print("Please provide a valid day number")
+        print("Please provide a valid day number, range or 'all'")
+        return
+    if not days:
+        print(f"No solutions found for days {args.days}")
+        return
+
+    if args.input and len(days) > 1:
+        print("--input can only be used with a single day")
+        return
+
+    parts = [args.part] if args.part else [1, 2]
+    if args.profile or args.trace_hot:
+        run_profile(days, parts, args.input, args.top, args.profile_dir, args.trace_hot, args.variant)
+        return
+    if args.verify:
+        if not run_verify(days, parts, args.input, args.record, args.json):
+            sys.exit(1)
+        return
+    if args.scale:
+        scales = [float(scale) for scale in args.scale.split(',')]
+        run_scaling(days, parts, scales, args.seed, args.json, args.variant, args.fastest)
+        return
+    run_benchmark(days, parts, args.json, args.jobs, args.split_parts, args.input, args.import_time,
+                  args.variant, args.fastest)
 
 if __name__ == "__main__":
     main()
@@ -1,41 +1,178 @@
-import numpy as np
-from src.utils.input_reader import read_numbers
+import os
+import tempfile
+import warnings
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-def solve_part1(numbers: list[list[int]]) -> int:
-    first_numbers = [pair[0] for pair in numbers]
-    second_numbers = [pair[1] for pair in numbers]
-    
-    # Sort both lists
-    first_numbers.sort()
-    second_numbers.sort()
-
-    # Create arrays and calculate difference
-    a = np.array(first_numbers, dtype=np.int64)
-    b = np.array(second_numbers, dtype=np.int64)
-    c = np.abs(a - b)
-    
-    return np.sum(c, dtype=np.int64)
+from src.utils.input_reader import input_path, read_int_array, InputSource
+from src.utils.solver import Solver
 
-def solve_part2(numbers: list[list[int]]) -> int:
-    first_numbers = [pair[0] for pair in numbers]
-    second_numbers = [pair[1] for pair in numbers]
-    
-    # Count occurrences of second numbers
-    occurencies = {}
-    for num in second_numbers:
-        occurencies[num] = occurencies.get(num, 0) + 1
-    
-    # Calculate result
-    result = 0
-    for elem in first_numbers:
-        if elem in occurencies:
-            result += elem * occurencies[elem]
-    
-    return result
+if TYPE_CHECKING:
+    import numpy as np
+
+def to_columns(numbers: Union['np.ndarray', Iterable[Sequence[int]]]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Return the two location lists as int64 arrays.
+
+    Args:
+        numbers: (N, 2) int64 array from read_int_array, or pairs of numbers
+            (a list or a stream from iter_numbers), collected in a single pass
+
+    Returns:
+        Tuple of (first column, second column)
+    """
+    import numpy as np
+
+    if isinstance(numbers, np.ndarray):
+        pairs = numbers
+    else:
+        pairs = np.fromiter(chain.from_iterable(numbers), dtype=np.int64).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+def solve_part1(numbers: Union['np.ndarray', Iterable[Sequence[int]]]) -> int:
+    import numpy as np
+
+    first_numbers, second_numbers = to_columns(numbers)
+
+    # Pair up the smallest with the smallest, and so on
+    a = np.sort(first_numbers)
+    b = np.sort(second_numbers)
+
+    return int(np.abs(a - b).sum(dtype=np.int64))
+
+def solve_part2(numbers: Union['np.ndarray', Iterable[Sequence[int]]]) -> int:
+    """
+    Sum every number of the first list times its count in the second list.
+
+    Both lists are reduced to (value, count) with np.unique, and the
+    distinct values of the first list are looked up in those of the second
+    with np.searchsorted, so the lookup only touches distinct values.
+    """
+    import numpy as np
+
+    first_numbers, second_numbers = to_columns(numbers)
+
+    first_values, first_counts = np.unique(first_numbers, return_counts=True)
+    second_values, second_counts = np.unique(second_numbers, return_counts=True)
+    if len(second_values) == 0:
+        return 0
+
+    index = np.searchsorted(second_values, first_values)
+    index[index == len(second_values)] = 0
+    found = second_values[index] == first_values
+
+    return int(np.sum(first_values[found] * first_counts[found] * second_counts[index[found]],
+                      dtype=np.int64))
+
+def write_sorted_runs(source: InputSource, directory: str, chunk_rows: int) -> Tuple[List[str], List[str]]:
+    """
+    Split both columns into sorted runs of at most chunk_rows numbers.
+
+    The input is parsed chunk_rows lines at a time, and every chunk's two
+    columns are sorted and saved as .npy files in directory.
+
+    Returns:
+        Tuple of (run files of the first column, run files of the second column)
+    """
+    import numpy as np
+
+    first_runs, second_runs = [], []
+    with open(input_path(source), 'r') as file, warnings.catch_warnings():
+        # The read after the last chunk finds no data, which loadtxt warns about
+        warnings.simplefilter('ignore', UserWarning)
+        while True:
+            pairs = np.loadtxt(file, dtype=np.int64, max_rows=chunk_rows, ndmin=2)
+            if pairs.size == 0:
+                break
+            for column, runs in ((0, first_runs), (1, second_runs)):
+                path = os.path.join(directory, f'run{column}-{len(runs)}.npy')
+                np.save(path, np.sort(pairs[:, column]))
+                runs.append(path)
+    return first_runs, second_runs
+
+def merge_runs(paths: List[str], block_rows: int) -> Iterator['np.ndarray']:
+    """
+    K-way merge sorted .npy runs into a stream of sorted blocks.
+
+    Runs are memory-mapped and read block_rows numbers at a time. In every
+    step, everything up to the smallest last value of the runs' next blocks
+    can be emitted, since no run has anything smaller left after it.
+    """
+    import numpy as np
+
+    runs = [np.load(path, mmap_mode='r') for path in paths]
+    positions = [0] * len(runs)
+    while True:
+        active = [i for i, run in enumerate(runs) if positions[i] < len(run)]
+        if not active:
+            return
+        ends = [min(positions[i] + block_rows, len(runs[i])) for i in active]
+        threshold = min(runs[i][end - 1] for i, end in zip(active, ends))
+
+        parts = []
+        for i, end in zip(active, ends):
+            block = runs[i][positions[i]:end]
+            take = int(np.searchsorted(block, threshold, side='right'))
+            parts.append(block[:take])
+            positions[i] += take
+        yield np.sort(np.concatenate(parts))
+
+def rechunk(blocks: Iterator['np.ndarray'], size: int) -> Iterator['np.ndarray']:
+    """Regroup a stream of arrays into arrays of exactly size elements (the last may be shorter)."""
+    import numpy as np
+
+    pending, count = [], 0
+    for block in blocks:
+        pending.append(block)
+        count += len(block)
+        while count >= size:
+            joined = np.concatenate(pending)
+            yield joined[:size]
+            pending, count = [joined[size:]], count - size
+    if count:
+        yield np.concatenate(pending)
+
+def solve_part1_external(source: InputSource, chunk_rows: int = 1 << 22, block_rows: int = 1 << 16,
+                         temp_dir: Optional[str] = None) -> int:
+    """
+    Out-of-core part 1 for inputs that do not fit in memory.
+
+    Both columns are sorted in chunks of chunk_rows into temporary .npy runs
+    (external sort), then the runs of each column are k-way merged and the
+    two sorted streams are paired up block by block while summing |a - b|.
+    Memory stays bounded by chunk_rows while sorting and by
+    runs * block_rows while merging, whatever the input size.
+
+    Args:
+        source: Day number or path of the input file
+        chunk_rows: Lines sorted in memory at once
+        block_rows: Numbers read from every run per merge step
+        temp_dir: Where to put the runs (default: the system temp directory)
+    """
+    import numpy as np
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        first_runs, second_runs = write_sorted_runs(source, directory, chunk_rows)
+        first_sorted = rechunk(merge_runs(first_runs, block_rows), block_rows)
+        second_sorted = rechunk(merge_runs(second_runs, block_rows), block_rows)
+
+        total = 0
+        for a, b in zip(first_sorted, second_sorted):
+            total += int(np.abs(a - b).sum(dtype=np.int64))
+        return total
+
+def read_input(source: InputSource = 1) -> tuple:
+    return (read_int_array(source),)
+
+SOLVERS = [
+    Solver('day01', read_input, solve_part1, solve_part2),
+    Solver('day01_external', lambda source: (source,), part1=solve_part1_external),
+]
 
 def main():
-    numbers = read_numbers(1)
-    
+    # The C reader streams the file, so inputs larger than RAM as text still fit as an array
+    numbers, = read_input()
+
     part1_result = solve_part1(numbers)
     print(f"Part 1: {part1_result}")
     
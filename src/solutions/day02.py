@@ -1,23 +1,29 @@
-import numpy as np
-from src.utils.input_reader import read_numbers
+from typing import TYPE_CHECKING, Iterable
+from src.utils.input_reader import read_int_rows, read_numbers, InputSource
+from src.utils.solver import Solver
+
+if TYPE_CHECKING:
+    import numpy as np
 
 def check_safe(arr: list[int]) -> bool:
-    differences = [np.abs(arr[i] - arr[i + 1]) for i in range(len(arr) - 1)]
+    differences = [abs(arr[i] - arr[i + 1]) for i in range(len(arr) - 1)]
     is_sorted = arr == sorted(arr)
     is_sorted_desc = arr == sorted(arr, reverse=True)
-    min_diff = np.min(differences)
-    max_diff = np.max(differences)
-    
+    min_diff = min(differences)
+    max_diff = max(differences)
+
     return (is_sorted or is_sorted_desc) and min_diff >= 1 and max_diff <= 3
 
 def check_reduced(arr: list[int], num: int) -> bool:
     arr_reduced = [arr[j] for j in range(len(arr)) if j != num]
     return check_safe(arr_reduced)
 
-def solve_part1(numbers: list[list[int]]) -> int:
+def solve_part1_per_report(numbers: Iterable[list[int]]) -> int:
+    """Count safe reports; numbers may be a list or a stream from iter_numbers."""
     return sum(1 for arr in numbers if check_safe(arr))
 
-def solve_part2(numbers: list[list[int]]) -> int:
+def solve_part2_per_report(numbers: Iterable[list[int]]) -> int:
+    """Count reports that are safe with at most one level removed (single pass)."""
     count = 0
     for arr in numbers:
         for i in range(len(arr)):
@@ -26,13 +32,76 @@ def solve_part2(numbers: list[list[int]]) -> int:
                 break
     return count
 
+def increasing_steps(levels: 'np.ndarray', lengths: 'np.ndarray', gap: int = 1) -> 'np.ndarray':
+    """
+    Check levels[i + gap] - levels[i] is between 1 and 3 for every report.
+
+    Steps that reach into the padding are reported as valid, so that they
+    never make a report unsafe.
+    """
+    import numpy as np
+
+    steps = levels[:, gap:] - levels[:, :-gap]
+    padding = np.arange(steps.shape[1]) + gap >= lengths[:, None]
+    return ((steps >= 1) & (steps <= 3)) | padding
+
+def safe_with_one_removed(levels: 'np.ndarray', lengths: 'np.ndarray') -> 'np.ndarray':
+    """
+    For every report, check it is increasing safely with any one level removed.
+
+    Removing level k leaves a safe report if the levels before k and the
+    levels after k are safe on their own, and the bridge from level k - 1 to
+    level k + 1 is a safe step. Prefix and suffix validity are running ANDs
+    over the steps, so this is linear in the report length.
+    """
+    import numpy as np
+
+    count, width = levels.shape
+    valid = np.ones((count, width), dtype=bool)
+    if width < 2:
+        return valid.any(axis=1) | (lengths == 0)
+
+    ok = increasing_steps(levels, lengths)
+    prefix = np.logical_and.accumulate(ok, axis=1)
+    suffix = np.logical_and.accumulate(ok[:, ::-1], axis=1)[:, ::-1]
+
+    # Levels 0..k-1 are safe if steps 0..k-2 are, levels k+1.. if steps k+1.. are
+    valid[:, 2:] &= prefix[:, :-1]
+    valid[:, :-2] &= suffix[:, 1:]
+    if width > 2:
+        bridge = increasing_steps(levels, lengths, gap=2)
+        valid[:, 1:-1] &= bridge
+
+    valid &= np.arange(width) < lengths[:, None]
+    return valid.any(axis=1)
+
+def solve_part1(levels: 'np.ndarray', lengths: 'np.ndarray') -> int:
+    """Count safe reports, checking all reports at once."""
+    safe = increasing_steps(levels, lengths).all(axis=1) | increasing_steps(-levels, lengths).all(axis=1)
+    return int(safe.sum())
+
+def solve_part2(levels: 'np.ndarray', lengths: 'np.ndarray') -> int:
+    """Count reports that are safe with at most one level removed, all reports at once."""
+    safe = safe_with_one_removed(levels, lengths) | safe_with_one_removed(-levels, lengths)
+    return int(safe.sum())
+
+def read_input(source: InputSource = 2) -> tuple:
+    """Read all reports packed as (levels, lengths)."""
+    return read_int_rows(source)
+
+SOLVERS = [
+    Solver('day02', read_input, solve_part1, solve_part2),
+    Solver('day02_per_report', lambda source: (read_numbers(source),),
+           solve_part1_per_report, solve_part2_per_report),
+]
+
 def main():
-    numbers = read_numbers(2)
-    
-    part1_result = solve_part1(numbers)
+    levels, lengths = read_input()
+
+    part1_result = solve_part1(levels, lengths)
     print(f"Part 1: {part1_result}")
-    
-    part2_result = solve_part2(numbers)
+
+    part2_result = solve_part2(levels, lengths)
     print(f"Part 2: {part2_result}")
 
 if __name__ == "__main__":
@@ -1,84 +1,206 @@
-from src.utils.input_reader import read_chars
+from src.utils.input_reader import read_chars, read_bytes, iter_bytes, input_path, InputSource
+from src.utils.solver import Solver
+from typing import Iterable, Optional, Tuple
+import os
 import re
 
+# Regular expression to match mul(X,Y) where X and Y are 1-3 digit numbers
+MUL_PATTERN = r"mul\((\d{1,3}),(\d{1,3})\)"
+# Pattern to match either prefixes or mul(X,Y)
+MUL_OR_PREFIX_PATTERN = r"(do\(\)|don't\(\))|mul\((\d{1,3}),(\d{1,3})\)"
+# Longest token the patterns match: mul(123,456)
+MAX_TOKEN_LENGTH = 12
+
+def compile_for(pattern: str, data):
+    """Compile pattern as str or bytes regex, depending on the type of data."""
+    if isinstance(data, str):
+        return re.compile(pattern)
+    return re.compile(pattern.encode())
+
 def solve_part1(data) -> int:
     """
     Solve part 1 of the puzzle.
     
     Args:
-        data: Puzzle input
+        data: Puzzle input, a string or a bytes-like object such as the
+            memory map returned by read_bytes
 
     Returns:
         Solution to part 1
     """
-    # Regular expression to match mul(X,Y) where X and Y are 1-3 digit numbers
-    pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-
-    # Find all matches
-    matches = re.findall(pattern, data)
-
-    #DEBUG: print(matches)
-
+    # Iterate over matches instead of collecting them, so memory stays
+    # constant however large the input is
     rez = 0
-    for elem in matches:
-        a,b = float(elem[0]), float(elem[1])
-        rez += a*b
-    return int(rez)
+    for match in compile_for(MUL_PATTERN, data).finditer(data):
+        rez += int(match[1]) * int(match[2])
+    return rez
 
 def solve_part2(data) -> int:
     """
     Solve part 2 of the puzzle.
     
     Args:
-        data: Puzzle input
+        data: Puzzle input, a string or a bytes-like object such as the
+            memory map returned by read_bytes
 
     Returns:
         Solution to part 2
     """
-    # Pattern to match either prefixes or mul(X,Y)
-    pattern = r"(do\(\)|don't\(\))|mul\((\d{1,3}),(\d{1,3})\)"
-
-    # Find all matches
-    matches = re.findall(pattern, data)
-
-    # Track the last seen prefix
-    last_prefix = "nothing (beginning)"
-    results = []
-
-    for match in matches:
-        if match[0]:  # If this is a prefix (do() or don't())
-            last_prefix = match[0]
-        else:  # If this is a mul(X,Y)
-            x, y = match[1], match[2]
-            results.append({"group_type": last_prefix, "mul": f"mul({x},{y})"})
-    
-    # print(results)
-
+    # Track the last seen prefix; multiplications are enabled at the beginning
+    enabled = True
     rez = 0
-    for elem in results:
-        if elem['group_type'] != "don't()":
-            # print(elem['mul'])
-            rez += solve_part1(elem['mul'])
+
+    for match in compile_for(MUL_OR_PREFIX_PATTERN, data).finditer(data):
+        prefix = match[1]
+        if prefix:  # If this is a prefix (do() or don't())
+            enabled = prefix in ("do()", b"do()")
+        elif enabled:  # If this is a mul(X,Y)
+            rez += int(match[2]) * int(match[3])
 
     return rez
 
-def main():
-    # Read the input
-    data = read_chars(3)  # Using read_lines by default, change if needed
-    
-    combined_data = ''.join(data)
-    # data = data[0] #only one string
+def scan_chunks(chunks: Iterable[bytes], enabled: bool = True) -> Tuple[int, int, bool]:
+    """
+    Solve both parts in a single pass over a stream of byte chunks.
+
+    Tokens can be split between chunks, so the tail of every chunk that
+    could still be the start of one (up to MAX_TOKEN_LENGTH - 1 bytes after
+    the last match) is carried over to the next chunk. Every complete match
+    ends with ')' and cannot be changed by what follows, so matches are
+    counted as soon as they are seen. Memory is bounded by the chunk size.
+
+    Args:
+        chunks: Input bytes in order, e.g. from iter_bytes
+        enabled: Whether mul instructions are enabled at the start
+
+    Returns:
+        Tuple of (sum of all products, sum of enabled products, enabled state at the end)
+    """
+    pattern = re.compile(MUL_OR_PREFIX_PATTERN.encode())
+    total = enabled_total = 0
+    carry = b''
+
+    for chunk in chunks:
+        buffer = carry + chunk
+        last_end = 0
+        for match in pattern.finditer(buffer):
+            prefix = match[1]
+            if prefix:
+                enabled = prefix == b"do()"
+            else:
+                product = int(match[2]) * int(match[3])
+                total += product
+                if enabled:
+                    enabled_total += product
+            last_end = match.end()
+        carry = buffer[max(last_end, len(buffer) - (MAX_TOKEN_LENGTH - 1)):]
+
+    return total, enabled_total, enabled
+
+def solve_part1_stream(source: InputSource) -> int:
+    """Part 1 by streaming the input file in chunks."""
+    return scan_chunks(iter_bytes(source))[0]
+
+def solve_part2_stream(source: InputSource) -> int:
+    """Part 2 by streaming the input file in chunks."""
+    return scan_chunks(iter_bytes(source))[1]
+
+def scan_range(path: str, start: int, end: int) -> Tuple[int, int, int, Optional[bool]]:
+    """
+    Scan the tokens starting in bytes [start, end) of a file (runs in a pool worker).
+
+    Whether mul instructions are enabled at start is not known yet, so the
+    products before the first do()/don't() are added to the enabled sum of
+    the "started enabled" case only; after it, both cases agree.
+
+    Returns:
+        Tuple of (sum of all products, enabled sum if started enabled,
+        enabled sum if started disabled, state after the last do()/don't()
+        or None if the range has none)
+    """
+    pattern = re.compile(MUL_OR_PREFIX_PATTERN.encode())
+    total = if_enabled = if_disabled = 0
+    state = None
+
+    with read_bytes(path) as data:
+        # Read past end so that a token starting before end is seen whole;
+        # one starting at or after end belongs to the next range
+        for match in pattern.finditer(data, start, min(end + MAX_TOKEN_LENGTH - 1, len(data))):
+            if match.start() >= end:
+                break
+            prefix = match[1]
+            if prefix:
+                state = prefix == b"do()"
+                continue
+            product = int(match[2]) * int(match[3])
+            total += product
+            if state is None:
+                if_enabled += product
+            elif state:
+                if_enabled += product
+                if_disabled += product
+
+    return total, if_enabled, if_disabled, state
+
+def solve_parallel(source: InputSource, workers: Optional[int] = None,
+                   chunks: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Solve both parts by scanning ranges of the input on the shared worker pool.
 
+    Every worker memory-maps the file and scans its own byte range; the
+    partial sums are then combined in order, following the enabled state
+    from one range to the next.
+
+    Args:
+        source: Day number or path of the input file
+        workers: Number of worker processes (default: os.cpu_count())
+        chunks: Number of ranges (default: 4 per worker, to balance the load)
+
+    Returns:
+        Tuple of (part 1, part 2)
+    """
+    from src.utils.parallel import get_executor
+
+    path = input_path(source)
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, 0
+    chunks = min(chunks or 4 * workers, size)
+    bounds = [size * i // chunks for i in range(chunks + 1)]
+
+    executor = get_executor(workers)
+    futures = [executor.submit(scan_range, path, start, end) for start, end in zip(bounds, bounds[1:])]
+
+    part1 = part2 = 0
+    enabled = True
+    for future in futures:
+        total, if_enabled, if_disabled, state = future.result()
+        part1 += total
+        part2 += if_enabled if enabled else if_disabled
+        if state is not None:
+            enabled = state
+    return part1, part2
+
+def read_input(source: InputSource = 3) -> tuple:
+    return (''.join(read_chars(source)),)
+
+SOLVERS = [
+    Solver('day03', read_input, solve_part1, solve_part2),
+    Solver('day03_stream', lambda source: (source,), solve_part1_stream, solve_part2_stream),
+    # One scan yields both answers, but every part is timed on a scan of its own
+    Solver('day03_parallel', lambda source: (source,),
+           lambda source: solve_parallel(source)[0], lambda source: solve_parallel(source)[1]),
+]
+
+def main():
     # Test string
     # test_string = "xmul(2,4)%&mul[3,7]!@^do_not_mul(5,5)+mul(32,64]then(mul(11,8)mul(8,5))"
+    # test_data = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
 
-    # Solve part 1
-    part1_result = solve_part1(combined_data)
+    # Both parts in one streaming pass, so dumps larger than RAM are read only once
+    part1_result, part2_result, _ = scan_chunks(iter_bytes(3))
     print(f"Part 1: {part1_result}")
-
-    # test_data = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"    
-    # Solve part 2
-    part2_result = solve_part2(combined_data)
     print(f"Part 2: {part2_result}")
 
 if __name__ == "__main__":
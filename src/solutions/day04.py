@@ -1,14 +1,20 @@
 import os
 import sys
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 # Add the project root directory to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from src.utils.input_reader import read_lines
+from src.utils.grid_search import DIRECTION_NAMES, find_stencils, find_word, find_words, rotations, stencil_from_rows
+from src.utils.input_reader import read_grid, read_lines, InputSource
+from src.utils.solver import Solver
+from src.utils.verbosity import log, is_verbose
+
+# Part 2 pattern: two MAS crossing on the A, in any rotation
+X_MAS = rotations(stencil_from_rows(["M.S", ".A.", "M.S"]))
 
 def get_sequences_from_position(array: np.ndarray, i: int, j: int, length: int = 4) -> List[Tuple[str, str]]:
     """
@@ -111,9 +117,10 @@ def count_all_xmas_matches(array: np.ndarray) -> int:
                     matches_found.append((i, j, direction))
     
     # Print detailed match information
-    print("\nFound XMAS matches at:")
-    for i, j, direction in matches_found:
-        print(f"Position ({i},{j}) in direction {direction}")
+    if is_verbose():
+        log("\nFound XMAS matches at:")
+        for i, j, direction in matches_found:
+            log(f"Position ({i},{j}) in direction {direction}")
     
     return total_matches
 
@@ -179,13 +186,14 @@ def find_all_pattern_matches(array: np.ndarray):
                 matches_found.append((i, j, rotations))
     
     # Print results
-    print("\nFound pattern matches:")
-    for i, j, rotations in matches_found:
-        print(f"Position ({i},{j}):")
-        print("3x3 pattern found:")
-        for row in array[i:i+3, j:j+3]:
-            print(''.join(row))
-        print(f"Matching rotations: {', '.join(rotations)}\n")
+    if is_verbose():
+        log("\nFound pattern matches:")
+        for i, j, rotations in matches_found:
+            log(f"Position ({i},{j}):")
+            log("3x3 pattern found:")
+            for row in array[i:i+3, j:j+3]:
+                log(''.join(row))
+            log(f"Matching rotations: {', '.join(rotations)}\n")
     
     return len(matches_found)
 
@@ -195,9 +203,9 @@ def parse_input(data):
     char_list = [list(line.strip()) for line in data]
     return np.array(char_list)
 
-def solve_part1(data) -> int:
+def solve_part1_per_cell(data) -> int:
     """
-    Solve part 1 of the puzzle.
+    Solve part 1 of the puzzle, building the strings around every cell.
     
     Args:
         data: List of strings, each containing a sequence of M, S, A, X characters
@@ -210,13 +218,13 @@ def solve_part1(data) -> int:
     
     # Count all XMAS matches in the array
     total_matches = count_all_xmas_matches(char_array)
-    print(f"\nTotal XMAS matches found: {total_matches}")
+    log(f"\nTotal XMAS matches found: {total_matches}")
     
     return total_matches
 
-def solve_part2(data) -> int:
+def solve_part2_per_cell(data) -> int:
     """
-    Solve part 2 of the puzzle.
+    Solve part 2 of the puzzle, checking the rotations of every 3x3 window.
     
     Args:
         data: List of strings, each containing a sequence of M, S, A, X characters
@@ -229,20 +237,89 @@ def solve_part2(data) -> int:
     
     # Find all 3x3 pattern matches
     total_matches = find_all_pattern_matches(char_array)
-    print(f"\nTotal 3x3 pattern matches found: {total_matches}")
+    log(f"\nTotal 3x3 pattern matches found: {total_matches}")
     
     return total_matches
 
+def solve_part1(grid: np.ndarray) -> int:
+    """
+    Solve part 1 of the puzzle with shifted-grid comparisons.
+
+    Args:
+        grid: uint8 letter grid from read_grid
+
+    Returns:
+        Number of XMAS in all eight directions
+    """
+    if not is_verbose():
+        return find_word(grid, "XMAS")
+
+    total_matches, positions = find_word(grid, "XMAS", return_positions=True)
+    log("\nFound XMAS matches at:")
+    for i, j, direction in positions:
+        log(f"Position ({i},{j}) in direction {DIRECTION_NAMES[direction]}")
+    return total_matches
+
+def solve_part2(grid: np.ndarray) -> int:
+    """
+    Solve part 2 of the puzzle with shifted-grid comparisons.
+
+    Args:
+        grid: uint8 letter grid from read_grid
+
+    Returns:
+        Number of 3x3 windows holding an X-MAS in any rotation
+    """
+    if not is_verbose():
+        return find_stencils(grid, X_MAS)
+
+    total_matches, positions = find_stencils(grid, X_MAS, return_positions=True)
+    log("\nFound pattern matches:")
+    for i, j in positions:
+        log(f"Position ({i},{j})")
+    return total_matches
+
+def search_dictionary(grid: np.ndarray, words: Sequence[str]) -> Dict[str, int]:
+    """
+    Count every word of a dictionary in the grid, in all eight directions.
+
+    All words are found in a single Aho–Corasick pass over the rows,
+    columns and diagonals, instead of one search per word. Matches are
+    listed with -v.
+    """
+    if not is_verbose():
+        return find_words(grid, words)
+
+    counts, positions = find_words(grid, words, return_positions=True)
+    for word, matches in positions.items():
+        log(f"\n{word}: {counts[word]} matches")
+        for i, j, direction in matches:
+            log(f"Position ({i},{j}) in direction {DIRECTION_NAMES[direction]}")
+    return counts
+
+def solve_part1_dictionary(grid: np.ndarray) -> int:
+    """Part 1 as a one-word dictionary search."""
+    return search_dictionary(grid, ["XMAS"])["XMAS"]
+
+def read_input(source: InputSource = 4) -> tuple:
+    """Read the letter grid as a uint8 array of character codes."""
+    return (read_grid(source),)
+
+SOLVERS = [
+    Solver('day04', read_input, solve_part1, solve_part2),
+    Solver('day04_dictionary', read_input, part1=solve_part1_dictionary),
+    Solver('day04_per_cell', lambda source: (read_lines(source),), solve_part1_per_cell, solve_part2_per_cell),
+]
+
 def main():
-    # Read data from 4.txt
-    data = read_lines(4)
+    grid, = read_input()
     
     # Solve part 1
-    part1_result = solve_part1(data)
+    part1_result = solve_part1(grid)
     print(f"\nPart 1: {part1_result}")
     
     # Solve part 2
-    part2_result = solve_part2(data)
+    part2_result = solve_part2(grid)
     print(f"\nPart 2: {part2_result}")
 
 if __name__ == "__main__":
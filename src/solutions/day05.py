@@ -1,6 +1,13 @@
-from src.utils.input_reader import read_lines, read_numbers
-from typing import List, Tuple, Dict
+from src.utils.input_reader import read_lines, read_numbers, cached_parse, InputSource
+from src.utils.solver import Solver
+from src.utils.verbosity import log, is_verbose
+from collections import deque
+from typing import TYPE_CHECKING, List, Tuple, Dict, Set
 
+if TYPE_CHECKING:
+    import numpy as np
+
+@cached_parse
 def parse_input(data: List[str]) -> Tuple[List[Tuple[str, str]], List[List[str]], Dict[int, str]]:
     """
     Parse the input into:
@@ -55,7 +62,9 @@ def fix_list_ordering(pairs: List[Tuple[str, str]], values: List[str]) -> List[s
     fixed_values = values.copy()
     position_dict = get_position_dict(fixed_values)
     
-    print(f"\nFixing list: {','.join(values)}")
+    verbose = is_verbose()
+    if verbose:
+        log(f"\nFixing list: {','.join(values)}")
     
     # Keep swapping until all pairs are in correct order
     changes_made = True
@@ -71,11 +80,13 @@ def fix_list_ordering(pairs: List[Tuple[str, str]], values: List[str]) -> List[s
                     # Update position dictionary
                     position_dict = get_position_dict(fixed_values)
                     changes_made = True
-                    print(f"Swapped {left}({left_pos}) with {right}({right_pos})")
-                    print(f"New order: {','.join(fixed_values)}")
+                    if verbose:
+                        log(f"Swapped {left}({left_pos}) with {right}({right_pos})")
+                        log(f"New order: {','.join(fixed_values)}")
     
-    print(f"Final order: {','.join(fixed_values)}")
-    print(f"Middle value: {get_middle_value(fixed_values)}")
+    if verbose:
+        log(f"Final order: {','.join(fixed_values)}")
+        log(f"Middle value: {get_middle_value(fixed_values)}")
     return fixed_values
 
 def get_middle_value(values: List[str]) -> str:
@@ -83,48 +94,198 @@ def get_middle_value(values: List[str]) -> str:
     middle_idx = len(values) // 2
     return values[middle_idx]
 
-def solve_part1(data) -> int:
+def build_rule_index(pairs: List[Tuple[str, str]]) -> Dict[str, Set[str]]:
+    """Map every page to the set of pages that must come after it."""
+    after = {}
+    for left, right in pairs:
+        after.setdefault(left, set()).add(right)
+    return after
+
+def is_valid_update(after: Dict[str, Set[str]], values: List[str]) -> bool:
+    """
+    Check an update against the rule index, looking at adjacent pages only.
+
+    The rules order every pair of pages of an update, so the update is
+    valid exactly when no adjacent pair is reversed.
+    """
+    return all(left not in after.get(right, ()) for left, right in zip(values, values[1:]))
+
+def topological_order(after: Dict[str, Set[str]], values: List[str]) -> List[str]:
+    """
+    Order the pages of an update with Kahn's algorithm, using only the rules
+    between pages of this update.
+    """
+    pages = set(values)
+    successors = {page: after.get(page, set()) & pages for page in values}
+    indegree = dict.fromkeys(values, 0)
+    for page in values:
+        for successor in successors[page]:
+            indegree[successor] += 1
+
+    ready = deque(page for page in values if indegree[page] == 0)
+    order = []
+    while ready:
+        page = ready.popleft()
+        order.append(page)
+        for successor in successors[page]:
+            indegree[successor] -= 1
+            if indegree[successor] == 0:
+                ready.append(successor)
+
+    if len(order) != len(values):
+        raise ValueError(f"Rules for update {','.join(values)} contain a cycle")
+    return order
+
+def solve_part1(pairs: List[Tuple[str, str]], lists: List[List[str]]) -> int:
     """
     Solve part 1 of the puzzle.
     Sum of middle values from valid lists.
     """
-    pairs, lists, _ = parse_input(data)
+    after = build_rule_index(pairs)
+    return sum(int(get_middle_value(lst)) for lst in lists if is_valid_update(after, lst))
+
+def solve_part2(pairs: List[Tuple[str, str]], lists: List[List[str]]) -> int:
+    """
+    Solve part 2 of the puzzle.
+    Sum of middle values from invalid lists put in order by a topological sort.
+    """
+    after = build_rule_index(pairs)
+
+    invalid_lists = [lst for lst in lists if not is_valid_update(after, lst)]
+    log(f"\nFound {len(invalid_lists)} invalid lists")
+
+    total = 0
+    for lst in invalid_lists:
+        fixed_list = topological_order(after, lst)
+        if is_verbose():
+            log(f"Fixed {','.join(lst)} -> {','.join(fixed_list)}")
+        total += int(get_middle_value(fixed_list))
+
+    log(f"\nTotal sum of middle values from fixed lists: {total}")
+    return total
+
+def solve_part1_pairwise(pairs: List[Tuple[str, str]], lists: List[List[str]]) -> int:
+    """
+    Solve part 1 of the puzzle, checking every rule against every list.
+    Sum of middle values from valid lists.
+    """
     valid_lists = [lst for lst in lists if is_valid_list(pairs, lst)]
     return sum(int(get_middle_value(lst)) for lst in valid_lists)
 
-def solve_part2(data) -> int:
+def solve_part2_pairwise(pairs: List[Tuple[str, str]], lists: List[List[str]]) -> int:
     """
-    Solve part 2 of the puzzle.
+    Solve part 2 of the puzzle, swapping pages until every rule holds.
     Sum of middle values from fixed invalid lists.
     """
-    pairs, lists, _ = parse_input(data)
     
     # Get only invalid lists
     invalid_lists = [lst for lst in lists if not is_valid_list(pairs, lst)]
-    print(f"\nFound {len(invalid_lists)} invalid lists")
+    log(f"\nFound {len(invalid_lists)} invalid lists")
     
     # Fix each invalid list and get its new middle value
     fixed_middle_values = []
     for i, lst in enumerate(invalid_lists):
-        print(f"\nProcessing invalid list {i+1}/{len(invalid_lists)}")
+        log(f"\nProcessing invalid list {i+1}/{len(invalid_lists)}")
         fixed_list = fix_list_ordering(pairs, lst)
         middle_value = get_middle_value(fixed_list)
         fixed_middle_values.append(int(middle_value))
     
     total = sum(fixed_middle_values)
-    print(f"\nTotal sum of middle values from fixed lists: {total}")
+    log(f"\nTotal sum of middle values from fixed lists: {total}")
     return total
 
+def encode_updates(pairs: List[Tuple[str, str]], lists: List[List[str]]) -> tuple:
+    """
+    Map page ids to small integers and pack the rules and updates into arrays.
+
+    Returns:
+        Tuple of (precedence matrix, where precedes[a, b] is True for a rule
+        a|b, updates as a (n, max length) array of page indices, length of
+        every update, page number of every page index). Updates are padded
+        with an extra page index that has no rules.
+    """
+    import numpy as np
+
+    pages = sorted({page for pair in pairs for page in pair} | {page for lst in lists for page in lst})
+    index = {page: i for i, page in enumerate(pages)}
+    padding = len(pages)
+
+    precedes = np.zeros((padding + 1, padding + 1), dtype=bool)
+    if pairs:
+        rules = np.array([(index[left], index[right]) for left, right in pairs], dtype=np.int64)
+        precedes[rules[:, 0], rules[:, 1]] = True
+
+    lengths = np.array([len(lst) for lst in lists], dtype=np.int64)
+    width = int(lengths.max()) if len(lists) else 0
+    updates = np.full((len(lists), width), padding, dtype=np.int64)
+    for row, lst in enumerate(lists):
+        updates[row, :len(lst)] = [index[page] for page in lst]
+
+    page_numbers = np.array([int(page) for page in pages] + [0], dtype=np.int64)
+    return precedes, updates, lengths, page_numbers
+
+def read_input(source: InputSource = 5) -> tuple:
+    """Read and parse the input into (rule pairs, updates)."""
+    pairs, lists, _ = parse_input(read_lines(source))
+    return pairs, lists
+
+def read_input_batched(source: InputSource = 5) -> tuple:
+    """Read the rules and updates encoded as arrays (see encode_updates)."""
+    return encode_updates(*read_input(source))
+
+def valid_updates(precedes: 'np.ndarray', updates: 'np.ndarray') -> 'np.ndarray':
+    """
+    Check all updates at once: an update is valid when no adjacent pair
+    (u[i], u[i + 1]) has a rule u[i + 1]|u[i]. Padding has no rules, so it
+    never makes an update invalid.
+    """
+    return ~precedes[updates[:, 1:], updates[:, :-1]].any(axis=1)
+
+def middle_pages(updates: 'np.ndarray', lengths: 'np.ndarray') -> 'np.ndarray':
+    """Page index in the middle of every update."""
+    import numpy as np
+    return updates[np.arange(len(updates)), lengths // 2]
+
+def solve_part1_batched(precedes: 'np.ndarray', updates: 'np.ndarray', lengths: 'np.ndarray',
+                        page_numbers: 'np.ndarray') -> int:
+    """Sum of middle pages of the valid updates, all updates at once."""
+    valid = valid_updates(precedes, updates)
+    return int(page_numbers[middle_pages(updates, lengths)][valid].sum())
+
+def solve_part2_batched(precedes: 'np.ndarray', updates: 'np.ndarray', lengths: 'np.ndarray',
+                        page_numbers: 'np.ndarray') -> int:
+    """
+    Sum of middle pages of the invalid updates once ordered, all updates at once.
+
+    In the ordered update, a page's position is the number of pages of the
+    update that must come before it, so the middle page is the one with
+    length // 2 predecessors; no update has to be sorted.
+    """
+    invalid = ~valid_updates(precedes, updates)
+    updates, lengths = updates[invalid], lengths[invalid]
+
+    # before[n, i, j]: page j of update n must come before its page i
+    before = precedes[updates[:, None, :], updates[:, :, None]]
+    rank = before.sum(axis=2)
+    is_middle = (rank == (lengths // 2)[:, None]) & (updates != len(page_numbers) - 1)
+    return int(page_numbers[updates][is_middle].sum())
+
+SOLVERS = [
+    Solver('day05', read_input, solve_part1, solve_part2),
+    Solver('day05_batched', read_input_batched, solve_part1_batched, solve_part2_batched),
+    Solver('day05_pairwise', read_input, solve_part1_pairwise, solve_part2_pairwise),
+]
+
 def main():
     # Read the input
-    data = read_lines(5)
+    pairs, lists = read_input()
     
     # Solve part 1
-    part1_result = solve_part1(data)
+    part1_result = solve_part1(pairs, lists)
     print(f"Part 1: {part1_result}")
     
     # Solve part 2
-    part2_result = solve_part2(data)
+    part2_result = solve_part2(pairs, lists)
     print(f"Part 2: {part2_result}")
 
 if __name__ == "__main__":
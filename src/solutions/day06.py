@@ -1,15 +1,56 @@
 from copy import deepcopy
-from src.utils.input_reader import read_lines
-import numpy as np
-from numpy.typing import NDArray
-from typing import Set, Tuple, List
-import multiprocessing as mp
+from src.utils.input_reader import read_grid, find_char, InputSource
+from src.utils.parallel import SharedArray, get_executor
+from src.utils.solver import Solver
+from src.utils.verbosity import log
+from typing import TYPE_CHECKING, Set, Tuple, List
+import os
 import time
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 # Direction vectors for UP, RIGHT, DOWN, LEFT (in clockwise order)
 DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
 
-def solve_part1(matrix: NDArray, test_pos: Tuple[int, int] = None) -> int:
+# Cell values of the uint8 map returned by read_grid
+EMPTY = ord('.')
+OBSTACLE = ord('#')
+
+class VisitedStates:
+    """
+    Set of visited (cell, direction) states of the guard, for loop detection.
+
+    Every cell (numbered row * cols + col) has a uint8 bitmask with one bit
+    per direction, and a generation stamp: the bits of a cell only count if
+    its stamp equals the current generation. reset() starts a new
+    generation, so one tracker is reused for every simulation without
+    clearing the arrays or allocating per state.
+    """
+
+    def __init__(self, cells: int):
+        self.bits = bytearray(cells)
+        self.stamps = [0] * cells
+        self.generation = 1
+
+    def reset(self):
+        """Forget all states."""
+        self.generation += 1
+
+    def visit(self, cell: int, direction: int) -> bool:
+        """Record a state, and return True if it was already visited."""
+        bit = 1 << direction
+        if self.stamps[cell] != self.generation:
+            self.stamps[cell] = self.generation
+            self.bits[cell] = bit
+            return False
+        if self.bits[cell] & bit:
+            return True
+        self.bits[cell] |= bit
+        return False
+
+def solve_part1(matrix: 'NDArray', test_pos: Tuple[int, int] = None,
+                states: VisitedStates = None, cells: bytes = None) -> int:
     """
     Solve part 1 of the puzzle.
     Track the guard's movement according to the rules:
@@ -17,80 +58,92 @@ def solve_part1(matrix: NDArray, test_pos: Tuple[int, int] = None) -> int:
     2. Otherwise, move forward one step
     
     Args:
-        matrix: Numpy array representing the lab map
+        matrix: uint8 array of character codes representing the lab map
         test_pos: Optional position to treat as an obstacle for part 2
+        states: Optional tracker to reuse across calls (it is reset here)
+        cells: Optional flat copy of the map (matrix.tobytes()) to reuse
+            across calls
     
     Returns:
         Number of distinct positions visited by the guard,
         or -1 if a loop is detected
     """
+    rows, cols = matrix.shape
+    # Cells are numbered row * cols + col in a flat copy of the map, so that
+    # a step only does integer arithmetic instead of building position tuples
+    if cells is None:
+        cells = matrix.tobytes()
+    blocked = -1 if test_pos is None else test_pos[0] * cols + test_pos[1]
+
     # Find starting position and initialize direction (0 = UP)
-    start_y, start_x = np.where(matrix == '^')
-    current_pos = (int(start_y[0]), int(start_x[0]))
+    current = cells.index(ord('^'))
+    row = current // cols
+    col = current - row * cols
     current_dir = 0  # Start facing UP
-    
-    # Track visited positions
-    visited = {current_pos}
-    # Track state (position, direction) to detect loops
-    states = {(current_pos, current_dir)}
-    rows, cols = matrix.shape
+
+    # Track state (position, direction) to detect loops; a cell is stamped
+    # by the tracker once the guard stands on it, which also counts the
+    # distinct visited positions
+    if states is None:
+        states = VisitedStates(rows * cols)
+    states.reset()
+    stamps, generation = states.stamps, states.generation
+    states.visit(current, current_dir)
+    visited = 1
     
     while True:
         # Calculate position in front of guard
         dy, dx = DIRECTIONS[current_dir]
-        front_pos = (current_pos[0] + dy, current_pos[1] + dx)
+        front_row, front_col = row + dy, col + dx
+        front = current + dy * cols + dx
         
         # Check if front position is out of bounds, has obstacle, or is test position
-        if (not (0 <= front_pos[0] < rows and 0 <= front_pos[1] < cols) or 
-            matrix[front_pos] == '#' or front_pos == test_pos):
+        if (not (0 <= front_row < rows and 0 <= front_col < cols) or
+            cells[front] == OBSTACLE or front == blocked):
             # Turn right (clockwise)
             current_dir = (current_dir + 1) % 4
             # Check if we've seen this state before (loop detection)
-            if (current_pos, current_dir) in states:
+            if states.visit(current, current_dir):
                 return -1  # Loop detected
-            states.add((current_pos, current_dir))
         else:
             # Move forward
-            current_pos = front_pos
-            visited.add(current_pos)
+            row, col, current = front_row, front_col, front
+            if stamps[current] != generation:
+                visited += 1
             # Check if we've seen this state before (loop detection)
-            if (current_pos, current_dir) in states:
+            if states.visit(current, current_dir):
                 return -1  # Loop detected
-            states.add((current_pos, current_dir))
-            
+
             # Check if guard has left the mapped area
-            if (current_pos[0] == 0 or current_pos[0] == rows-1 or 
-                current_pos[1] == 0 or current_pos[1] == cols-1):
+            if row == 0 or row == rows-1 or col == 0 or col == cols-1:
                 # One more step would take us out of bounds
-                next_pos = (current_pos[0] + DIRECTIONS[current_dir][0], 
-                          current_pos[1] + DIRECTIONS[current_dir][1])
-                if not (0 <= next_pos[0] < rows and 0 <= next_pos[1] < cols):
+                if not (0 <= row + dy < rows and 0 <= col + dx < cols):
                     break
     
-    return len(visited)
+    return visited
 
-def solve_part2(matrix: NDArray) -> int:
+def solve_part2(matrix: 'NDArray') -> int:
     """Original part 2 solution"""
     start_time = time.time()
     rows, cols = matrix.shape
+    # Shared by all candidate runs, which then allocate nothing per candidate
+    states = VisitedStates(rows * cols)
+    cells = matrix.tobytes()
     loops = []
 
     for i in range(rows):
         for j in range(cols):
-            if matrix[i,j] == '.':
-                matrix[i,j] = '#'
-                if solve_part1(matrix) < 0:
+            if matrix[i,j] == EMPTY:
+                if solve_part1(matrix, (i, j), states, cells) < 0:
                     loops.append((i,j))
-                matrix[i,j] = '.'
     
     duration = time.time() - start_time
-    print(f"Part 2 original took {duration:.2f} seconds")
+    log(f"Part 2 original took {duration:.2f} seconds")
     return len(loops)
 
-def get_original_path(matrix: NDArray) -> Set[Tuple[int, int]]:
+def get_original_path(matrix: 'NDArray') -> Set[Tuple[int, int]]:
     """Get the path the guard takes without any additional obstacles"""
-    start_y, start_x = np.where(matrix == '^')
-    current_pos = (int(start_y[0]), int(start_x[0]))
+    current_pos = find_char(matrix, '^')
     current_dir = 0
     path = {current_pos}
     rows, cols = matrix.shape
@@ -100,7 +153,7 @@ def get_original_path(matrix: NDArray) -> Set[Tuple[int, int]]:
         front_pos = (current_pos[0] + dy, current_pos[1] + dx)
         
         if (not (0 <= front_pos[0] < rows and 0 <= front_pos[1] < cols) or 
-            matrix[front_pos] == '#'):
+            matrix[front_pos] == OBSTACLE):
             current_dir = (current_dir + 1) % 4
         else:
             current_pos = front_pos
@@ -115,55 +168,43 @@ def get_original_path(matrix: NDArray) -> Set[Tuple[int, int]]:
     
     return path
 
-def check_positions(args) -> List[Tuple[int, int]]:
-    """Process a chunk of positions to check for loops"""
-    matrix, positions = args
+def check_positions(shared: SharedArray, positions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Process a chunk of positions to check for loops (runs in a pool worker)"""
+    matrix = shared.array()
+    states = VisitedStates(matrix.size)
+    cells = matrix.tobytes()
     loops = []
     for pos in positions:
-        if solve_part1(matrix, pos) < 0:
+        if solve_part1(matrix, pos, states, cells) < 0:
             loops.append(pos)
     return loops
 
-def solve_part2_advanced(matrix: NDArray) -> int:
+def solve_part2_advanced(matrix: 'NDArray') -> int:
     """
     Optimized part 2 solution using:
     1. Pre-calculate original path
-    2. Only test positions near the path
-    3. Parallel processing
+    2. Only test positions on the path
+    3. Parallel processing on the shared worker pool, with the matrix
+       passed through shared memory instead of pickled into every task
     4. Avoid matrix modifications
     """
     start_time = time.time()
     
-    # Get the original path
+    # Only cells on the original path can change the guard's route
     original_path = get_original_path(matrix)
-    
-    # Get all empty positions near the path
-    rows, cols = matrix.shape
-    test_positions = []
-    for i in range(rows):
-        for j in range(cols):
-            if matrix[i,j] == '.':
-                # Check if position is near the path (within 2 steps)
-                for dy in range(-2, 3):
-                    for dx in range(-2, 3):
-                        if (i+dy, j+dx) in original_path:
-                            test_positions.append((i,j))
-                            break
-                    if (i,j) in test_positions:
-                        break
+    test_positions = sorted(pos for pos in original_path if matrix[pos] == EMPTY)
     
     # Split positions into chunks for parallel processing
-    num_processes = mp.cpu_count()
+    num_processes = os.cpu_count() or 1
+    executor = get_executor(num_processes)
     chunk_size = max(1, len(test_positions) // num_processes)
     chunks = [test_positions[i:i + chunk_size] 
              for i in range(0, len(test_positions), chunk_size)]
     
-    # Prepare arguments for parallel processing
-    args = [(matrix, chunk) for chunk in chunks]
-    
     # Process chunks in parallel
-    with mp.Pool(processes=num_processes) as pool:
-        results = pool.map(check_positions, args)
+    with SharedArray.create(matrix) as shared:
+        futures = [executor.submit(check_positions, shared, chunk) for chunk in chunks]
+        results = [future.result() for future in futures]
     
     # Combine results
     loops = []
@@ -171,22 +212,201 @@ def solve_part2_advanced(matrix: NDArray) -> int:
         loops.extend(result)
     
     duration = time.time() - start_time
-    print(f"Part 2 advanced took {duration:.2f} seconds")
+    log(f"Part 2 advanced took {duration:.2f} seconds")
     return len(loops)
 
+def build_jump_table(matrix: 'NDArray') -> List[List[int]]:
+    """
+    For every direction and cell, find where a guard walking from that cell
+    stops: the last cell before the next obstacle in that direction.
+
+    Cells are numbered row * cols + col. When the guard walks off the map
+    instead, the entry is the bitwise complement (~cell) of the last cell on
+    the map, so stops are >= 0 and exits are < 0.
+
+    Returns:
+        jumps[direction][cell], as lists (faster to index from Python than arrays)
+    """
+    import numpy as np
+
+    rows, cols = matrix.shape
+    obstacle = matrix == OBSTACLE
+    row_index = np.broadcast_to(np.arange(rows)[:, None], (rows, cols))
+    col_index = np.broadcast_to(np.arange(cols), (rows, cols))
+
+    # Row / column of the nearest obstacle in every direction, excluding the
+    # cell itself; the map edge counts as an obstacle just outside the map
+    up = np.maximum.accumulate(np.where(obstacle, row_index, -1), axis=0)
+    up = np.vstack([np.full((1, cols), -1), up[:-1]])
+    down = np.minimum.accumulate(np.where(obstacle, row_index, rows)[::-1], axis=0)[::-1]
+    down = np.vstack([down[1:], np.full((1, cols), rows)])
+    left = np.maximum.accumulate(np.where(obstacle, col_index, -1), axis=1)
+    left = np.hstack([np.full((rows, 1), -1), left[:, :-1]])
+    right = np.minimum.accumulate(np.where(obstacle, col_index, cols)[:, ::-1], axis=1)[:, ::-1]
+    right = np.hstack([right[:, 1:], np.full((rows, 1), cols)])
+
+    # Stop one cell short of the obstacle, in the order of DIRECTIONS
+    stops = [
+        ((up + 1) * cols + col_index, up < 0),
+        (row_index * cols + right - 1, right == cols),
+        ((down - 1) * cols + col_index, down == rows),
+        (row_index * cols + left + 1, left < 0),
+    ]
+    return [np.where(exits, ~stop, stop).ravel().tolist() for stop, exits in stops]
+
+def guard_start(matrix: 'NDArray') -> int:
+    """Cell number of the guard's starting position (facing up)."""
+    row, col = find_char(matrix, '^')
+    return row * matrix.shape[1] + col
+
+def solve_part1_jumps(matrix: 'NDArray') -> int:
+    """
+    Solve part 1 by jumping from turn to turn with the jump table.
+
+    Returns:
+        Number of distinct positions visited by the guard,
+        or -1 if a loop is detected
+    """
+    jumps = build_jump_table(matrix)
+    rows, cols = matrix.shape
+    steps = [-cols, 1, cols, -1]
+
+    cell, direction = guard_start(matrix), 0
+    visited = bytearray(rows * cols)
+    turns = VisitedStates(rows * cols)
+    while True:
+        target = jumps[direction][cell]
+        end = target if target >= 0 else ~target
+        step = steps[direction]
+        for walked in range(cell, end + step, step):
+            visited[walked] = 1
+        if target < 0:
+            return rows * cols - visited.count(0)
+
+        direction = (direction + 1) % 4
+        if turns.visit(target, direction):
+            return -1
+        cell = target
+
+def loops_with_obstacle(jumps: List[List[int]], cols: int, cell: int, direction: int, obstacle: int,
+                        turns: VisitedStates) -> bool:
+    """
+    Check if the guard loops once an obstacle is added at cell number obstacle.
+
+    The guard jumps from turn to turn through the jump table of the
+    original map; the extra obstacle only matters when it lies on the
+    current segment, in which case the guard stops in front of it instead.
+    Only the states right after a turn are recorded for loop detection, in
+    turns (which is reset first).
+    """
+    turns.reset()
+    bits, stamps, generation = turns.bits, turns.stamps, turns.generation
+    while True:
+        target = jumps[direction][cell]
+        end = target if target >= 0 else ~target
+
+        # Cell numbers grow along a row and down a column, so the segment is
+        # a range of cell numbers (every cols-th one for a column)
+        if direction == 0:
+            if end <= obstacle < cell and (cell - obstacle) % cols == 0:
+                target = obstacle + cols
+        elif direction == 1:
+            if cell < obstacle <= end:
+                target = obstacle - 1
+        elif direction == 2:
+            if cell < obstacle <= end and (obstacle - cell) % cols == 0:
+                target = obstacle - cols
+        elif end <= obstacle < cell:
+            target = obstacle + 1
+
+        if target < 0:
+            return False
+        # Inlined turns.visit(target, direction), as this is the hot loop
+        direction = (direction + 1) % 4
+        bit = 1 << direction
+        if stamps[target] != generation:
+            stamps[target] = generation
+            bits[target] = bit
+        elif bits[target] & bit:
+            return True
+        else:
+            bits[target] |= bit
+        cell = target
+
+def route_candidates(jumps: List[List[int]], cols: int, start: int) -> List[Tuple[int, int, int]]:
+    """
+    Walk the original route and list the cells where an obstacle can change it.
+
+    An obstacle off the route is never reached, so only route cells (other
+    than the start) are candidates. The guard's moves before it first
+    enters a cell do not depend on an obstacle there, so its simulation can
+    resume from the state just before that.
+
+    Returns:
+        List of (cell, predecessor cell, direction) in route order
+
+    Raises:
+        ValueError: If the original route is a loop
+    """
+    steps = [-cols, 1, cols, -1]
+    seen = {start}
+    turns = VisitedStates(len(jumps[0]))
+    candidates = []
+    cell, direction = start, 0
+    while True:
+        target = jumps[direction][cell]
+        end = target if target >= 0 else ~target
+        step = steps[direction]
+        for walked in range(cell + step, end + step, step):
+            if walked not in seen:
+                seen.add(walked)
+                candidates.append((walked, walked - step, direction))
+        if target < 0:
+            return candidates
+        cell, direction = target, (direction + 1) % 4
+        if turns.visit(cell, direction):
+            raise ValueError("The guard never leaves the map")
+
+def solve_part2_jumps(matrix: 'NDArray') -> int:
+    """
+    Count the cells where an obstacle makes the guard loop, simulating every
+    cell of the original route with the jump table of the original map,
+    starting right before the guard first enters it.
+    """
+    start_time = time.time()
+    jumps = build_jump_table(matrix)
+    cols = matrix.shape[1]
+
+    candidates = route_candidates(jumps, cols, guard_start(matrix))
+    log(f"Testing {len(candidates)} cells of the original route")
+    turns = VisitedStates(matrix.size)
+    loops = sum(1 for obstacle, cell, direction in candidates
+                if loops_with_obstacle(jumps, cols, cell, direction, obstacle, turns))
+
+    log(f"Part 2 with jump tables took {time.time() - start_time:.2f} seconds")
+    return loops
+
+def read_input(source: InputSource = 6) -> tuple:
+    """Read the lab map as a uint8 matrix of character codes."""
+    return (read_grid(source),)
+
+SOLVERS = [
+    Solver('day06_jumps', read_input, solve_part1_jumps, solve_part2_jumps),
+    Solver('day06', read_input, solve_part1, solve_part2),
+    Solver('day06_advanced', read_input, part2=solve_part2_advanced),
+]
+
 def main():
-    # Read the input lines and convert to numpy matrix
-    data = read_lines(6)
-    matrix = np.array([list(line) for line in data])
+    # Read the lab map as a uint8 matrix
+    matrix, = read_input()
     
     # Solve part 1
-    part1_result = solve_part1(matrix)
+    part1_result = solve_part1_jumps(matrix)
     print(f"Part 1: {part1_result}")
     
-    # Solve part 2 with both methods
-    part2_result = solve_part2(matrix.copy())
-    part2_advanced_result = solve_part2_advanced(matrix.copy())
-    print(f"Part 2 results - Original: {part2_result}, Advanced: {part2_advanced_result}")
+    # Solve part 2
+    part2_result = solve_part2_jumps(matrix)
+    print(f"Part 2: {part2_result}")
 
 if __name__ == "__main__":
     main()
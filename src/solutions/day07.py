@@ -1,4 +1,4 @@
-from src.utils.input_reader import read_lines
+from src.utils.input_reader import iter_lines
 from itertools import product
 
 def concatenate_numbers(a, b):
@@ -91,7 +91,7 @@ def solve_part1(data) -> int:
     Solve part 1 of the puzzle.
     
     Args:
-        data: List of input lines
+        data: Input lines, either a list or a stream from iter_lines
     
     Returns:
         Sum of test values from valid equations using only + and *
@@ -110,7 +110,7 @@ def solve_part2(data) -> int:
     Solve part 2 of the puzzle.
     
     Args:
-        data: List of input lines
+        data: Input lines, either a list or a stream from iter_lines
     
     Returns:
         Sum of test values from valid equations using +, *, and ||
@@ -125,15 +125,13 @@ def solve_part2(data) -> int:
     return total
 
 def main():
-    # Read the input
-    data = read_lines(7)
-    
+    # Equations are independent, so stream them line by line
     # Solve part 1
-    part1_result = solve_part1(data)
+    part1_result = solve_part1(iter_lines(7))
     print(f"Part 1: {part1_result}")
     
     # Solve part 2
-    part2_result = solve_part2(data)
+    part2_result = solve_part2(iter_lines(7))
     print(f"Part 2: {part2_result}")
 
 if __name__ == "__main__":
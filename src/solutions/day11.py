@@ -1,4 +1,5 @@
 from src.utils.input_reader import read_lines, read_numbers
+from src.utils.verbosity import log
 from collections import defaultdict
 
 def solve_with_blinks_showing_evolution(data: list, num_blinks: int) -> int:
@@ -9,8 +10,8 @@ def solve_with_blinks_showing_evolution(data: list, num_blinks: int) -> int:
     input = [x for x in data[0].split(' ')]
     current = input
     
-    print('Initial arrangement:')
-    print(current,'\n')
+    log('Initial arrangement:')
+    log(current,'\n')
     
     for i in range(num_blinks):
         new_state = []
@@ -21,9 +22,9 @@ def solve_with_blinks_showing_evolution(data: list, num_blinks: int) -> int:
             else:
                 new_state.append(l)
                 new_state.append(r)
-        print(f'After {i+1} blinks:')
-        print(new_state,'\n')
-        print(f'Result is count stones = {len(new_state)}')
+        log(f'After {i+1} blinks:')
+        log(new_state,'\n')
+        log(f'Result is count stones = {len(new_state)}')
         current = new_state
     
     return len(current)
@@ -37,8 +38,8 @@ def solve_with_blinks_optimized(data: list, num_blinks: int) -> int:
     for num in data[0].split(' '):
         number_counts[num] += 1
     
-    print("\nBlink progression:")
-    print(f"Initial state - Unique numbers: {len(number_counts)}, Total numbers: {sum(number_counts.values())}, Average count: {sum(number_counts.values())/len(number_counts):.2f}")
+    log("\nBlink progression:")
+    log(f"Initial state - Unique numbers: {len(number_counts)}, Total numbers: {sum(number_counts.values())}, Average count: {sum(number_counts.values())/len(number_counts):.2f}")
     
     for i in range(num_blinks):
         new_counts = defaultdict(int)
@@ -51,7 +52,7 @@ def solve_with_blinks_optimized(data: list, num_blinks: int) -> int:
                 new_counts[r] += count
         number_counts = new_counts
         avg_count = sum(number_counts.values())/len(number_counts)
-        print(f"Blink {i+1} - Unique numbers: {len(number_counts)}, Total numbers: {sum(number_counts.values())}, Average count: {avg_count:.2f}")
+        log(f"Blink {i+1} - Unique numbers: {len(number_counts)}, Total numbers: {sum(number_counts.values())}, Average count: {avg_count:.2f}")
     
     return sum(number_counts.values())
 
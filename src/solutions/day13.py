@@ -1,6 +1,6 @@
 from typing import List, Tuple
 from src.utils.input_reader import read_lines
-import numpy as np
+from src.utils.verbosity import log, is_verbose
 
 def parse_line(line: str) -> Tuple[int, int]:
     """Parse a line like 'Button A: X+23, Y+33' or 'Prize: X=6801, Y=3810'"""
@@ -9,8 +9,8 @@ def parse_line(line: str) -> Tuple[int, int]:
     y_part = parts[1].split('Y')[1].strip('+= ')
     return int(x_part), int(y_part)
 
-def parse_input(lines: List[str], prize_offset: int = 0) -> List[Tuple[np.ndarray, np.ndarray]]:
-    """Parse input into list of (matrix A, vector y) pairs"""
+def parse_input(lines: List[str], prize_offset: int = 0) -> List[Tuple[Tuple[int, int, int, int], Tuple[int, int]]]:
+    """Parse input into list of ((ax, ay, bx, by), (px, py)) entries"""
     entries = []
     i = 0
     while i < len(lines):
@@ -61,17 +61,20 @@ def solve_equations(entries: List[Tuple[Tuple[int, int, int, int], Tuple[int, in
     """Calculate sum of 3*t1 + t2 for all valid integer solutions"""
     total = 0
     equation_num = 1
+    verbose = is_verbose()
     
     for (ax, ay, bx, by), (px, py) in entries:
-        print(f"\nEquation {equation_num} (Part {part}):")
-        print(f"System:")
-        print(f"{ax}*t1 + {bx}*t2 = {px}")
-        print(f"{ay}*t1 + {by}*t2 = {py}")
+        if verbose:
+            log(f"\nEquation {equation_num} (Part {part}):")
+            log(f"System:")
+            log(f"{ax}*t1 + {bx}*t2 = {px}")
+            log(f"{ay}*t1 + {by}*t2 = {py}")
         
         result = solve_2x2_system(ax, bx, ay, by, px, py)
         if result is not None:
             t1, t2 = result
-            print(f"Raw solution: t1={t1}, t2={t2}")
+            if verbose:
+                log(f"Raw solution: t1={t1}, t2={t2}")
             
             # Check if solution components are integers
             if is_integer(t1) and is_integer(t2):
@@ -81,23 +84,32 @@ def solve_equations(entries: List[Tuple[Tuple[int, int, int, int], Tuple[int, in
                 if verify_solution(ax, bx, ay, by, px, py, (t1, t2)):
                     # Check if solution is valid (positive times)
                     if t1 > 0 and t2 > 0:
-                        print(f"Integer solution found: t1={t1}, t2={t2}")
                         value = 3 * t1 + t2
-                        print(f"3*t1 + t2 = {value}")
+                        if verbose:
+                            log(f"Integer solution found: t1={t1}, t2={t2}")
+                            log(f"3*t1 + t2 = {value}")
                         total += value
-                    else:
-                        print(f"No valid solution (negative times: t1={t1}, t2={t2})")
+                    elif verbose:
+                        log(f"No valid solution (negative times: t1={t1}, t2={t2})")
                 else:
-                    print("Solution verification failed")
+                    log("Solution verification failed")
             else:
-                print("Non-integer solution")
+                log("Non-integer solution")
         else:
-            print("No solution exists (singular system)")
+            log("No solution exists (singular system)")
         
         equation_num += 1
     
     return total
 
+def solve_part1(lines: List[str]) -> int:
+    """Solve part 1 with the prize coordinates as given"""
+    return solve_equations(parse_input(lines), part=1)
+
+def solve_part2(lines: List[str]) -> int:
+    """Solve part 2 with 10^13 added to the prize coordinates"""
+    return solve_equations(parse_input(lines, prize_offset=10**13), part=2)
+
 def main():
     lines = read_lines(13)
     
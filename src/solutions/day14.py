@@ -1,6 +1,7 @@
 from typing import List, Tuple
 from statistics import stdev, mean
-from src.utils.input_reader import read_lines
+from src.utils.input_reader import read_lines, InputSource
+from src.utils.verbosity import log
 
 def parse_robot(line: str) -> Tuple[int, int, int, int]:
     """Parse a line like 'p=0,4 v=3,-3' into (x, y, dx, dy)"""
@@ -24,7 +25,7 @@ def print_grid(robots: List[Tuple[int, int, int, int]], width: int, height: int,
     min_y = max(0, min(y for _, y in positions) - 1)
     max_y = min(height, max(y for _, y in positions) + 2)
     
-    print(f"\nRobot positions at time {t}:")
+    log(f"\nRobot positions at time {t}:")
     for y in range(min_y, max_y):
         row = f"{y:2d} "
         for x in range(min_x, max_x):
@@ -33,8 +34,8 @@ def print_grid(robots: List[Tuple[int, int, int, int]], width: int, height: int,
                 row += '#'  # Use '#' for robots
             else:
                 row += '.'  # Use '.' for empty space
-        print(row)
-    print()
+        log(row)
+    log()
 
 def compute_safety_factor(robots: List[Tuple[int, int, int, int]], width: int, height: int, t: int) -> int:
     """Calculate safety factor (multiply quadrant counts)"""
@@ -48,7 +49,7 @@ def compute_safety_factor(robots: List[Tuple[int, int, int, int]], width: int, h
     bl = sum(1 for x, y in positions if x < limit_x and y > limit_y)
     br = sum(1 for x, y in positions if x > limit_x and y > limit_y)
     
-    print("Robots in quadrants:", tl, tr, bl, br)
+    log("Robots in quadrants:", tl, tr, bl, br)
     return tl * tr * bl * br
 
 def find_christmas_tree(robots: List[Tuple[int, int, int, int]], width: int, height: int) -> int:
@@ -76,41 +77,42 @@ def find_christmas_tree(robots: List[Tuple[int, int, int, int]], width: int, hei
         
         # Print current state periodically
         if t % 1000 == 0:
-            print(f"Time {t}, cluster value: {cluster_value:.2f}, mean: {mean_cluster:.2f}")
+            log(f"Time {t}, cluster value: {cluster_value:.2f}, mean: {mean_cluster:.2f}")
         
         # Check for significant clustering
         if cluster_value < mean_cluster * 0.8:
             if dt == 1:
                 # Found horizontal clustering, switch to vertical
-                print(f"Found horizontal clustering at time {t}")
+                log(f"Found horizontal clustering at time {t}")
                 print_grid(robots, width, height, t)
                 iterations = [stdev(y_coords)]  # Reset for vertical phase
                 dt = width
             else:
                 # Found both clusterings
-                print(f"Found complete pattern at time {t}")
+                log(f"Found complete pattern at time {t}")
                 print_grid(robots, width, height, t)
                 return t
         
         if t > 10000:
-            print("No pattern found within time limit")
+            log("No pattern found within time limit")
             return -1
             
         t += dt
 
-def solve_part1(robots: List[Tuple[int, int, int, int]], width: int, height: int, seconds: int) -> int:
+def solve_part1(robots: List[Tuple[int, int, int, int]], width: int = 101, height: int = 103, seconds: int = 100) -> int:
     """Calculate safety factor after given number of seconds"""
     return compute_safety_factor(robots, width, height, seconds)
 
-def solve_part2(robots: List[Tuple[int, int, int, int]], width: int, height: int) -> int:
+def solve_part2(robots: List[Tuple[int, int, int, int]], width: int = 101, height: int = 103) -> int:
     """Find time when robots form Christmas tree pattern"""
     return find_christmas_tree(robots, width, height)
 
+def read_input(source: InputSource = 14) -> tuple:
+    return ([parse_robot(line) for line in read_lines(source)],)
+
 def main():
-    lines = read_lines(14)
-    
     # Parse robots
-    robots = [parse_robot(line) for line in lines]
+    robots, = read_input()
     print(f"Total robots: {len(robots)}")
     
     # Part 1: Calculate safety factor at 100 seconds
@@ -1,5 +1,6 @@
 from re import L
-from src.utils.input_reader import read_lines, read_numbers
+from src.utils.input_reader import read_lines, read_numbers, InputSource
+from src.utils.solver import Solver
 import numpy as np
 
 def parse_input(data):
@@ -216,12 +217,16 @@ def solve_part2(grid, commands) -> int:
 
     return calc_grid_value(grid2)
 
+def read_input(source: InputSource = 15) -> tuple:
+    """Read and parse the input into (grid, commands)."""
+    return parse_input(read_lines(source))
+
+# Part 2 is left out, as it exceeds the recursion limit on the real input
+SOLVERS = [Solver('day15', read_input, solve_part1, mutates_input=True)]
+
 def main():
-    # Read the input
-    data = read_lines(15)
-    
-    # Parse the input
-    grid, commands = parse_input(data)
+    # Read and parse the input
+    grid, commands = read_input()
     
     # Solve part 1
     part1_result = solve_part1(grid, commands)
@@ -1,8 +1,9 @@
 from re import L
-from src.utils.input_reader import read_lines, read_numbers
+from src.utils.input_reader import read_lines, read_numbers, InputSource
+from src.utils.solver import Solver
+from src.utils.verbosity import log, is_verbose
 import numpy as np
 from collections import defaultdict, deque
-from tqdm import tqdm
 
 def parse_input(data):
     """Parse input into grid and commands."""
@@ -243,17 +244,25 @@ def solve_part1(grid, commands) -> int:
 
 def solve_part2(grid, commands) -> int:
     """Solve part 2 of the puzzle."""
+    from tqdm import tqdm
+
     grid2 = transform_grid_part2(grid)
 
-    print(f"Processing {len(commands)} commands...")
-    for command in tqdm(commands, desc="Processing commands"):
+    log(f"Processing {len(commands)} commands...")
+    for command in tqdm(commands, desc="Processing commands", disable=not is_verbose()):
         attempt_move_part2(grid2, command)
 
     return calc_grid_value(grid2)
 
+def read_input(source: InputSource = 15) -> tuple:
+    """Read and parse the input into (grid, commands)."""
+    return parse_input(read_lines(source))
+
+# Part 2 is left out, as it does not terminate on the real input
+SOLVERS = [Solver('day15_2', read_input, solve_part1, mutates_input=True)]
+
 def main():
-    data = read_lines(15)
-    grid, commands = parse_input(data)
+    grid, commands = read_input()
     
     part1_result = solve_part1(grid, commands)
     print(f"Part 1: {part1_result}")
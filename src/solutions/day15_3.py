@@ -1,5 +1,6 @@
 from itertools import product
-from src.utils.input_reader import read_lines
+from src.utils.input_reader import read_lines, InputSource
+from src.utils.solver import Solver
 
 EMPTY = '.'
 WALL = '#'
@@ -133,11 +134,7 @@ def compute_score(grid, part2=False):
         check = BIG_BOX_LEFT
     return sum(x * 100 + y for x, y in product(range(rows), range(cols)) if grid[x][y] == check)
 
-def main():
-    data = read_lines(15)
-    grid, expanded_grid, instructions = parse_input(data)
-    
-    # Part 1
+def solve_part1(grid, expanded_grid, instructions) -> int:
     robot_pos = get_start_pos(grid)
     dirs = convert_symbols_to_directions(instructions)
     
@@ -145,16 +142,32 @@ def main():
         if move_object(robot_pos, dir, grid):
             robot_pos = (robot_pos[0] + dir[0], robot_pos[1] + dir[1])
     
-    print('Part 1:', compute_score(grid))
-    
-    # Part 2
+    return compute_score(grid)
+
+def solve_part2(grid, expanded_grid, instructions) -> int:
     robot_pos = get_start_pos(expanded_grid)
+    dirs = convert_symbols_to_directions(instructions)
     
     for dir in dirs:
         if move_object_on_expanded_grid(robot_pos, dir, expanded_grid):
             robot_pos = (robot_pos[0] + dir[0], robot_pos[1] + dir[1])
     
-    print('Part 2:', compute_score(expanded_grid, True))
+    return compute_score(expanded_grid, True)
+
+def read_input(source: InputSource = 15) -> tuple:
+    """Read and parse the input into (grid, expanded_grid, instructions)."""
+    return parse_input(read_lines(source))
+
+SOLVERS = [Solver('day15_3', read_input, solve_part1, solve_part2, mutates_input=True)]
+
+def main():
+    grid, expanded_grid, instructions = read_input()
+    
+    # Part 1
+    print('Part 1:', solve_part1(grid, expanded_grid, instructions))
+    
+    # Part 2
+    print('Part 2:', solve_part2(grid, expanded_grid, instructions))
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
-from src.utils.input_reader import read_lines
+from src.utils.input_reader import read_lines, cached_parse
+from src.utils.verbosity import log, is_verbose
 from typing import List, Tuple, Set, Dict
 from collections import defaultdict, deque
 import sys
@@ -7,6 +8,7 @@ import sys
 DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
 DIR_CHARS = ['>', 'v', '<', '^']
 
+@cached_parse
 def parse_maze(data: List[str]) -> Tuple[List[List[str]], Tuple[int, int], Tuple[int, int]]:
     """Parse the maze and return the matrix and start/end positions."""
     matrix = [list(line) for line in data]
@@ -98,9 +100,9 @@ def visualize_best_paths(data: List[str], best_tiles: Set[Tuple[int, int]]) -> N
         if maze[row][col] not in ['S', 'E']:
             maze[row][col] = 'O'
     
-    print("\nBest paths visualization (O = part of a best path):")
+    log("\nBest paths visualization (O = part of a best path):")
     for row in maze:
-        print(''.join(row))
+        log(''.join(row))
 
 def solve_part1(data: List[str]) -> int:
     """Solve part 1: Find minimum score path through maze"""
@@ -112,7 +114,8 @@ def solve_part2(data: List[str]) -> int:
     """Solve part 2: Count tiles that are part of any best path"""
     matrix, start_pos, end_pos = parse_maze(data)
     _, best_tiles = find_all_min_score_paths(matrix, start_pos, end_pos)
-    visualize_best_paths(data, best_tiles)
+    if is_verbose():
+        visualize_best_paths(data, best_tiles)
     return len(best_tiles)
 
 def main():
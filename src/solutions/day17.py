@@ -1,4 +1,6 @@
 from src.utils.input_reader import read_lines
+from src.utils.solver import Solver
+from src.utils.verbosity import log
 import random
 
 class Computer:
@@ -128,9 +130,9 @@ def try_random_values(program, num_tries=10000000):
     max_val = int(28.15 * (10 ** 13))
     target = [2,4,1,5,7,5,1,6,4,3,5,5,0,3,3,0]
     
-    print(f"Target sequence: {target}")
-    print(f"Trying {num_tries:,} random values between {min_val} and {max_val}")
-    print("-" * 50)
+    log(f"Target sequence: {target}")
+    log(f"Trying {num_tries:,} random values between {min_val} and {max_val}")
+    log("-" * 50)
     
     # Track best example for each number of matching digits
     best_examples = {}  # key: num_matching, value: (A, sequence)
@@ -138,7 +140,7 @@ def try_random_values(program, num_tries=10000000):
     for i in range(num_tries):
         # Progress indicator every 100k tries
         if i > 0 and i % 100000 == 0:
-            print(f"Processed {i:,} values. Found examples for {len(best_examples)} different match lengths")
+            log(f"Processed {i:,} values. Found examples for {len(best_examples)} different match lengths")
         
         # Generate random A value in range
         a = random.randint(min_val, max_val)
@@ -151,19 +153,19 @@ def try_random_values(program, num_tries=10000000):
             # If this is the best example for this number of matching digits
             if matching > 0 and (matching not in best_examples or a < best_examples[matching][0]):
                 best_examples[matching] = (a, nums)
-                print(f"\nNew example for {matching} matching digits:")
-                print(f"A = {a}")
-                print(f"Sequence: {nums}")
+                log(f"\nNew example for {matching} matching digits:")
+                log(f"A = {a}")
+                log(f"Sequence: {nums}")
     
-    print("\nBest examples found for each number of matching digits:")
-    print("-" * 50)
+    log("\nBest examples found for each number of matching digits:")
+    log("-" * 50)
     for matching in sorted(best_examples.keys()):
         a, sequence = best_examples[matching]
-        print(f"\n{matching} matching digits:")
-        print(f"A = {a}")
-        print(f"Sequence: {sequence}")
-        print(f"Target:   {target}")
-        print(f"Match:    {''.join(['✓' if a==b else '✗' for a,b in zip(sequence, target)])}")
+        log(f"\n{matching} matching digits:")
+        log(f"A = {a}")
+        log(f"Sequence: {sequence}")
+        log(f"Target:   {target}")
+        log(f"Match:    {''.join(['✓' if a==b else '✗' for a,b in zip(sequence, target)])}")
     
     return best_examples
 
@@ -172,6 +174,10 @@ def solve_part2(data) -> int:
     try_random_values(program)
     return 0  # Placeholder return since we're just searching
 
+# solve_part2 is an exploratory random search that does not produce the
+# answer, so it is not registered; day17_solution solves part 2
+SOLVERS = [Solver('day17', lambda source: (read_lines(source),), solve_part1)]
+
 def main():
     data = read_lines(17)
     
@@ -1,4 +1,5 @@
 from src.utils.input_reader import read_lines
+from src.utils.verbosity import log
 
 class Computer:
     def __init__(self, a=0, b=0, c=0):
@@ -115,7 +116,7 @@ def find_valid_10bit_values(target_output, program, position):
         
         if len(outputs) > position and outputs[position] == target_output:
             valid_values.append(i)
-            print(f"Found value {bin(i)[2:].zfill(10)} for output {target_output} at position {position}")
+            log(f"Found value {bin(i)[2:].zfill(10)} for output {target_output} at position {position}")
     
     return valid_values
 
@@ -127,13 +128,13 @@ def solve_part2(data):
     # Find valid 10-bit values for each position
     valid_values = []
     for i, t in enumerate(target):
-        print(f"\nFinding values for output {t} at position {i}")
+        log(f"\nFinding values for output {t} at position {i}")
         values = find_valid_10bit_values(t, program, i)
         if not values:
-            print(f"No valid values found for output {t} at position {i}")
+            log(f"No valid values found for output {t} at position {i}")
             return None
         valid_values.append(values)
-        print(f"Found {len(values)} valid values")
+        log(f"Found {len(values)} valid values")
     
     # Try combining valid values
     def try_combination(pos=0, value=0):
@@ -163,15 +164,15 @@ def solve_part2(data):
     result = try_combination()
     
     if result:
-        print("\nVerifying solution:")
-        print(f"Final value (decimal): {result}")
-        print(f"Final value (octal): {oct(result)[2:]}")
+        log("\nVerifying solution:")
+        log(f"Final value (decimal): {result}")
+        log(f"Final value (octal): {oct(result)[2:]}")
         computer = Computer(result, 0, 0)
         computer.program = program
         outputs = computer.run()
-        print(f"Target sequence: {target}")
-        print(f"Actual outputs: {outputs}")
-        print(f"Matches: {outputs == target}")
+        log(f"Target sequence: {target}")
+        log(f"Actual outputs: {outputs}")
+        log(f"Matches: {outputs == target}")
     
     return result
 
@@ -1,9 +1,10 @@
 import numpy as np
 from src.utils.input_reader import read_lines, read_numbers
+from src.utils.verbosity import log, is_verbose
 
 def print_matrix(matrix:np.ndarray):
     for row in matrix:
-        print(' '.join(map(str,row)))
+        log(' '.join(map(str,row)))
     return
 
 def find_all_neighbours(w:np.ndarray[int], corrupted: np.ndarray[str], steps:int):
@@ -52,7 +53,8 @@ def solve_part1(data, is_part_two_call=False) -> int:
 
     # debug: print('Current stones field:')
     # print_matrix(matrix)
-    print(f'Running at stones count on the field ={max}, last stone added = {data[-1]}')
+    if is_verbose():
+        log(f'Running at stones count on the field ={max}, last stone added = {data[-1]}')
     # Find optimal path
     step = 1
     v = [(0,0)]
@@ -78,12 +80,14 @@ def solve_part2(data) -> int:
         Solution to part 2
     """
     max = len(data)
-    print(f'Max stones to come {max}')
+    log(f'Max stones to come {max}')
 
+    verbose = is_verbose()
     for cur in range(max):
         solve = solve_part1(data[0:cur+1], is_part_two_call=True)
-        print(f'Answer: min steps to reach exit = {solve}. If it is >-1, then the path is still not blocked')
-        print('-------')
+        if verbose:
+            log(f'Answer: min steps to reach exit = {solve}. If it is >-1, then the path is still not blocked')
+            log('-------')
         if solve==-1:
             return data[cur]
 
@@ -1,4 +1,5 @@
 from src.utils.input_reader import read_lines
+from src.utils.verbosity import log, is_verbose
 
 def solve_part1(data) -> int:
     """
@@ -16,15 +17,17 @@ def solve_part1(data) -> int:
     # Skip empty line and get designs
     designs = [line.strip() for line in data[2:] if line.strip()]
     
-    print(patterns)
-    print(designs)
+    log(patterns)
+    log(designs)
 
     count =0
+    verbose = is_verbose()
     for design in designs:
         available = is_available(design=design,patterns=patterns)
         if available:
             count+=1
-        print(f'Checking design  ={design}, available = {available}, current count of available designs={count}')
+        if verbose:
+            log(f'Checking design  ={design}, available = {available}, current count of available designs={count}')
 
     return count
 
@@ -75,9 +78,11 @@ def solve_part2(data) -> int:
     designs = [line.strip() for line in data[2:] if line.strip()]
     
     total = 0
+    verbose = is_verbose()
     for design in designs:
         combinations = count_available(design, patterns)
-        print(f"Design {design}: {combinations} combinations")
+        if verbose:
+            log(f"Design {design}: {combinations} combinations")
         total += combinations
     
     return total
@@ -0,0 +1,85 @@
+from collections import deque
+from typing import Iterable, List, Tuple
+
+class AhoCorasick:
+    """
+    Aho–Corasick automaton finding many byte patterns in a single pass.
+
+    The automaton is compiled into a full transition table (failure links
+    resolved at build time) over the alphabet of the patterns, so scanning
+    costs one table lookup per input byte however many patterns there are.
+    Bytes outside the alphabet reset the automaton, which makes them usable
+    as separators between independent texts.
+    """
+
+    def __init__(self, patterns: Iterable[bytes]):
+        self.patterns = [bytes(pattern) for pattern in patterns]
+        if any(not pattern for pattern in self.patterns):
+            raise ValueError("patterns must not be empty")
+
+        # Symbol 0 stands for every byte outside the alphabet
+        alphabet = sorted(set(b''.join(self.patterns)))
+        self.width = len(alphabet) + 1
+        table = bytearray(256)
+        for symbol, byte in enumerate(alphabet, start=1):
+            table[byte] = symbol
+        self._translation = bytes(table)
+
+        # Trie of the patterns
+        goto = [{}]
+        outputs = [[]]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern.translate(self._translation):
+                if symbol not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][symbol] = len(goto) - 1
+                state = goto[state][symbol]
+            outputs[state].append(index)
+
+        # Breadth-first, fill in failure transitions and inherit outputs
+        delta = [0] * (len(goto) * self.width)
+        fail = [0] * len(goto)
+        queue = deque()
+        for symbol, child in goto[0].items():
+            delta[symbol] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for symbol in range(1, self.width):
+                child = goto[state].get(symbol)
+                if child is None:
+                    delta[state * self.width + symbol] = delta[fail[state] * self.width + symbol]
+                else:
+                    fail[child] = delta[fail[state] * self.width + symbol]
+                    delta[state * self.width + symbol] = child
+                    queue.append(child)
+
+        self._delta = delta
+        self._outputs = [tuple(output) for output in outputs]
+
+    def find_all(self, text: bytes) -> List[Tuple[int, int]]:
+        """
+        Find every (possibly overlapping) occurrence of every pattern.
+
+        Returns:
+            List of (index of the last byte of the match, pattern index)
+        """
+        delta, outputs, width = self._delta, self._outputs, self.width
+        matches = []
+        state = 0
+        for position, symbol in enumerate(text.translate(self._translation)):
+            state = delta[state * width + symbol]
+            if outputs[state]:
+                for index in outputs[state]:
+                    matches.append((position, index))
+        return matches
+
+    def count(self, text: bytes) -> List[int]:
+        """Return the number of occurrences of every pattern in text."""
+        counts = [0] * len(self.patterns)
+        for _, index in self.find_all(text):
+            counts[index] += 1
+        return counts
@@ -0,0 +1,159 @@
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+
+def _rss_mb(process: psutil.Process) -> float:
+    """Return the resident set size of a process in megabytes."""
+    return process.memory_info().rss / (1024 * 1024)
+
+class PeakRssSampler:
+    """
+    Track the peak resident set size of the current process.
+
+    A background thread polls psutil while the context is active, so the
+    reported peak covers allocations that are freed again before the
+    measured code returns.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak_mb = max(self.peak_mb, _rss_mb(self.process))
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> 'PeakRssSampler':
+        self.peak_mb = _rss_mb(self.process)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, _rss_mb(self.process))
+
+def measure(func: Callable, *args) -> Dict[str, Any]:
+    """
+    Call func(*args) and record how expensive the call was.
+
+    Returns:
+        Dictionary with the result (or the error message if the call raised),
+        wall time and CPU time in seconds, and peak RSS in megabytes
+    """
+    result, error = None, None
+    with PeakRssSampler() as sampler:
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            result = func(*args)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        cpu_s = time.process_time() - cpu_start
+        wall_s = time.perf_counter() - wall_start
+
+    return {
+        'result': result,
+        'error': error,
+        'wall_s': wall_s,
+        'cpu_s': cpu_s,
+        'peak_rss_mb': sampler.peak_mb,
+    }
+
+def measure_import(module_name: str, cwd: str) -> Dict[str, Any]:
+    """
+    Measure how long importing a module takes in a fresh interpreter.
+
+    Runs python -X importtime -c "import module_name" so nothing is
+    already cached in sys.modules.
+
+    Returns:
+        Dictionary with the total import time in seconds and the heaviest
+        direct imports of the module as (name, seconds) pairs
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | <indent>package"
+    entries = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(cumulative) / 1e6))
+
+    # The module is the last top-level entry; its direct imports are the
+    # depth-1 entries listed right before it
+    import_s, children = 0.0, []
+    for depth, name, seconds in reversed(entries):
+        if depth == 0 and name == module_name:
+            import_s = seconds
+        elif depth == 0 and import_s:
+            break
+        elif depth == 1 and import_s:
+            children.append((name, seconds))
+
+    return {
+        'import_s': import_s,
+        'heaviest_imports': sorted(children, key=lambda child: child[1], reverse=True)[:3],
+    }
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    """Format benchmark rows as a fixed-width text table."""
+    with_imports = any('import_s' in row for row in rows)
+    import_header = f" {'Import (s)':>10}" if with_imports else ''
+    header = (f"{'Day':>4} {'Part':>4} {'Variant':<16} {'Parse (s)':>10} {'Wall (s)':>10} {'CPU (s)':>10} "
+              f"{'Peak RSS (MB)':>14}{import_header}  {'Input':<12} Answer")
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        answer = row['error'] if row['error'] else row['result']
+        import_column = f" {row.get('import_s', float('nan')):>10.3f}" if with_imports else ''
+        lines.append(
+            f"{row['day']:>4} {row['part']:>4} {row['variant']:<16} {row['parse_s']:>10.3f} {row['wall_s']:>10.3f} "
+            f"{row['cpu_s']:>10.3f} {row['peak_rss_mb']:>14.1f}{import_column}  {os.path.basename(row['input']):<12} {answer}"
+        )
+    return '\n'.join(lines)
+
+def format_verify_table(rows: List[Dict[str, Any]]) -> str:
+    """Format answer verification rows, with speedups relative to the baseline implementation."""
+    header = f"{'Day':>4} {'Part':>4} {'Variant':<16} {'Wall (s)':>10} {'Speedup':>8}  {'Status':<6} Answer"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        answer = row['error'] if row['error'] else row['result']
+        # No speedup for failed runs, or when no variant solved the part
+        speedup = f"{row['speedup']:>7.2f}x" if row['speedup'] is not None else f"{'-':>8}"
+        lines.append(
+            f"{row['day']:>4} {row['part']:>4} {row['variant']:<16} {row['wall_s']:>10.3f} "
+            f"{speedup}  {row['status']:<6} {answer}"
+        )
+    return '\n'.join(lines)
+
+def scaling_exponent(sizes: List[float], times: List[float]) -> float:
+    """
+    Estimate k in time ~ size^k with a least-squares fit in log-log space.
+
+    Returns:
+        The fitted exponent, or nan if fewer than two sizes were measured
+    """
+    points = [(math.log(size), math.log(max(t, 1e-9))) for size, t in zip(sizes, times)]
+    if len(points) < 2:
+        return float('nan')
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    cov_xy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov_xy / var_x
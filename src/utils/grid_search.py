@@ -0,0 +1,202 @@
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.utils.aho_corasick import AhoCorasick
+
+# (row step, column step) of the eight reading directions
+DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)]
+DIRECTION_NAMES = ["right", "left", "down", "up", "down-right", "up-left", "down-left", "up-right"]
+
+# A stencil is a list of (row offset, column offset, character) cells
+Stencil = List[Tuple[int, int, str]]
+
+def _start_slices(shape: Tuple[int, int], di: int, dj: int, length: int) -> Tuple[slice, slice]:
+    """Rows and columns where a word of given length fits, read in direction (di, dj)."""
+    height, width = shape
+    span_i, span_j = di * (length - 1), dj * (length - 1)
+    rows = slice(max(0, -span_i), height - max(0, span_i))
+    cols = slice(max(0, -span_j), width - max(0, span_j))
+    return rows, cols
+
+def _shifted(grid: np.ndarray, rows: slice, cols: slice, di: int, dj: int) -> np.ndarray:
+    """View on grid moved by (di, dj) relative to the rows and cols window."""
+    return grid[rows.start + di:rows.stop + di, cols.start + dj:cols.stop + dj]
+
+def word_mask(grid: np.ndarray, word: str, di: int, dj: int) -> np.ndarray:
+    """
+    Boolean array marking the cells where word starts when read in direction (di, dj).
+
+    Every letter is one comparison of a shifted view of the whole grid, so
+    the work is len(word) vectorized passes instead of a loop over cells.
+    """
+    mask = np.zeros(grid.shape, dtype=bool)
+    rows, cols = _start_slices(grid.shape, di, dj, len(word))
+    if rows.start >= rows.stop or cols.start >= cols.stop:
+        return mask
+
+    window = np.ones((rows.stop - rows.start, cols.stop - cols.start), dtype=bool)
+    for k, char in enumerate(word.encode()):
+        window &= _shifted(grid, rows, cols, di * k, dj * k) == char
+    mask[rows, cols] = window
+    return mask
+
+def find_word(grid: np.ndarray, word: str, directions: Sequence[Tuple[int, int]] = DIRECTIONS,
+              return_positions: bool = False) -> Union[int, Tuple[int, np.ndarray]]:
+    """
+    Count occurrences of word in a uint8 grid (see read_grid) in all given directions.
+
+    Args:
+        grid: 2-D uint8 array of character codes
+        word: Word to look for
+        directions: (row step, column step) pairs to read in
+        return_positions: Also return the matches
+
+    Returns:
+        Number of occurrences, or with return_positions a tuple of it and an
+        (N, 3) array of (row, col, direction index) of every match
+    """
+    masks = [word_mask(grid, word, di, dj) for di, dj in directions]
+    count = sum(int(mask.sum()) for mask in masks)
+    if not return_positions:
+        return count
+
+    positions = [np.column_stack((np.argwhere(mask), np.full(int(mask.sum()), index)))
+                 for index, mask in enumerate(masks)]
+    return count, np.concatenate(positions) if positions else np.empty((0, 3), dtype=np.int64)
+
+def stencil_from_rows(rows: Sequence[str], wildcard: str = '.') -> Stencil:
+    """Build a stencil from a picture like ["M.S", ".A.", "M.S"], where wildcard matches anything."""
+    return [(i, j, char) for i, row in enumerate(rows) for j, char in enumerate(row) if char != wildcard]
+
+def rotations(stencil: Stencil) -> List[Stencil]:
+    """Return the distinct quarter-turn rotations of a stencil."""
+    result = []
+    current = stencil
+    for _ in range(4):
+        # Rotate by 90 degrees and move back to non-negative offsets
+        turned = [(j, -i, char) for i, j, char in current]
+        min_i = min(i for i, _, _ in turned)
+        min_j = min(j for _, j, _ in turned)
+        current = sorted((i - min_i, j - min_j, char) for i, j, char in turned)
+        if current not in result:
+            result.append(current)
+    return result
+
+def stencil_mask(grid: np.ndarray, stencil: Stencil) -> np.ndarray:
+    """Boolean array marking the top-left corners of the windows where the stencil matches."""
+    height, width = grid.shape
+    span_i = max(i for i, _, _ in stencil)
+    span_j = max(j for _, j, _ in stencil)
+    mask = np.zeros(grid.shape, dtype=bool)
+    if span_i >= height or span_j >= width:
+        return mask
+
+    rows, cols = slice(0, height - span_i), slice(0, width - span_j)
+    window = np.ones((rows.stop, cols.stop), dtype=bool)
+    for i, j, char in stencil:
+        window &= _shifted(grid, rows, cols, i, j) == ord(char)
+    mask[rows, cols] = window
+    return mask
+
+def find_stencils(grid: np.ndarray, stencils: Sequence[Stencil],
+                  return_positions: bool = False) -> Union[int, Tuple[int, np.ndarray]]:
+    """
+    Count windows of a uint8 grid matching any of the stencils.
+
+    A window matching several stencils (e.g. symmetric rotations) is counted once.
+
+    Returns:
+        Number of matching windows, or with return_positions a tuple of it
+        and an (N, 2) array of their top-left (row, col)
+    """
+    mask = np.zeros(grid.shape, dtype=bool)
+    for stencil in stencils:
+        mask |= stencil_mask(grid, stencil)
+    count = int(mask.sum())
+    if return_positions:
+        return count, np.argwhere(mask)
+    return count
+
+def grid_lines(grid: np.ndarray) -> List[Tuple[bytes, int, int, int, int]]:
+    """
+    Extract every row, column, diagonal and anti-diagonal of a uint8 grid.
+
+    Returns:
+        List of (letters, start row, start col, row step, col step); the
+        lines read right, down, down-right and down-left, so reading them
+        backwards covers the other four directions
+    """
+    height, width = grid.shape
+    lines = []
+    for i in range(height):
+        lines.append((grid[i].tobytes(), i, 0, 0, 1))
+    for j in range(width):
+        lines.append((grid[:, j].tobytes(), 0, j, 1, 0))
+    flipped = grid[:, ::-1]
+    for offset in range(-(height - 1), width):
+        lines.append((grid.diagonal(offset).tobytes(), max(0, -offset), max(0, offset), 1, 1))
+        lines.append((flipped.diagonal(offset).tobytes(), max(0, -offset), width - 1 - max(0, offset), 1, -1))
+    return lines
+
+def find_words(grid: np.ndarray, words: Sequence[str],
+               return_positions: bool = False) -> Union[Dict[str, int], Tuple[Dict[str, int], Dict[str, np.ndarray]]]:
+    """
+    Count every word of a dictionary in all eight directions in one pass.
+
+    All rows, columns and diagonals are joined into one text (separated by
+    a byte that is not a letter) and scanned once with an Aho–Corasick
+    automaton holding every word and its reverse; a match of a reversed
+    word is an occurrence read backwards.
+
+    Args:
+        grid: 2-D uint8 array of character codes
+        words: Words to look for
+        return_positions: Also return the matches of every word
+
+    Returns:
+        Dictionary of word -> count, or with return_positions a tuple of it
+        and a dictionary of word -> (N, 3) array of (row, col, direction
+        index in DIRECTIONS) of every match
+    """
+    words = list(dict.fromkeys(words))
+    if not words:
+        return ({}, {}) if return_positions else {}
+    patterns = [word.encode() for word in words] + [word[::-1].encode() for word in words]
+    automaton = AhoCorasick(patterns)
+
+    lines = grid_lines(grid)
+    text = b'\n'.join(line for line, *_ in lines)
+    matches = np.array(automaton.find_all(text), dtype=np.int64).reshape(-1, 2)
+
+    counts = np.bincount(matches[:, 1] % len(words), minlength=len(words))
+    result = {word: int(count) for word, count in zip(words, counts)}
+    if not return_positions:
+        return result
+
+    # Locate every match in its line
+    starts = np.cumsum([0] + [len(line) + 1 for line, *_ in lines[:-1]])
+    meta = np.array([line[1:] for line in lines], dtype=np.int64).reshape(-1, 4)
+    ends, pattern = matches[:, 0], matches[:, 1]
+    line_index = np.searchsorted(starts, ends, side='right') - 1
+    end_offset = ends - starts[line_index]
+
+    word_index = pattern % len(words)
+    backwards = pattern >= len(words)
+    lengths = np.array([len(word) for word in words], dtype=np.int64)[word_index]
+    # A backwards match starts at its last letter in line order
+    first = np.where(backwards, end_offset, end_offset - lengths + 1)
+    row0, col0, di, dj = meta[line_index].T
+    rows, cols = row0 + first * di, col0 + first * dj
+
+    # Lines read right, down, down-right, down-left (DIRECTIONS 0, 2, 4, 6);
+    # the opposite direction follows each of them in DIRECTIONS
+    line_direction = np.select([(di == 0), (dj == 0), (dj == 1)], [0, 2, 4], 6)
+    direction = line_direction + backwards
+
+    positions = {}
+    for index, word in enumerate(words):
+        selected = word_index == index
+        positions[word] = np.column_stack((rows[selected], cols[selected], direction[selected]))
+    return result, positions
+
@@ -1,19 +1,262 @@
-def read_lines(day: int) -> list[str]:
+import functools
+import hashlib
+import mmap
+import os
+import pickle
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy is imported inside the grid helpers only, so that solutions working
+# on plain lists do not pay for importing it
+
+# Parsed results kept for the lifetime of the process, keyed on
+# (function name, digest of its input)
+_memo = {}
+
+# Directory for the persistent cache; None disables it
+_disk_cache_dir: Optional[str] = os.environ.get('AOC_CACHE_DIR')
+
+# Directory holding N.txt input files; defaults to inputs/ in the project root
+# so that solutions can be launched from any working directory
+_project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+_input_dir: str = os.environ.get('AOC_INPUT_DIR', os.path.join(_project_root, 'inputs'))
+
+# A day number (read from the input directory) or an explicit file path
+InputSource = Union[int, str, os.PathLike]
+
+def set_input_dir(path: str):
+    """Read day inputs from path instead of the default inputs/ directory."""
+    global _input_dir
+    _input_dir = path
+
+def set_disk_cache(path: Optional[str]):
+    """Persist parsed inputs as pickles under path (None disables the disk cache)."""
+    global _disk_cache_dir
+    _disk_cache_dir = path
+
+def clear_cache():
+    """Forget all in-process cached results."""
+    _memo.clear()
+
+def input_path(day: InputSource) -> str:
+    """
+    Return the path of the input file for given day.
+
+    An int is looked up as N.txt in the input directory (AOC_INPUT_DIR),
+    anything else is treated as an explicit path to the input file.
+    """
+    if isinstance(day, int):
+        return os.path.join(_input_dir, f'{day}.txt')
+    return os.fspath(day)
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents, hashed in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _cache_lookup(name: str, digest: str, compute: Callable):
+    """Return the cached result for (name, digest), computing and storing it on a miss."""
+    key = (name, digest)
+    if key in _memo:
+        return _memo[key]
+
+    cache_file = None
+    if _disk_cache_dir:
+        cache_file = os.path.join(_disk_cache_dir, f'{name}-{digest}.pkl')
+        if os.path.exists(cache_file):
+            with open(cache_file, 'rb') as file:
+                _memo[key] = pickle.load(file)
+            return _memo[key]
+
+    result = compute()
+    _memo[key] = result
+    if cache_file:
+        os.makedirs(_disk_cache_dir, exist_ok=True)
+        with open(cache_file, 'wb') as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return result
+
+def cached_reader(reader: Callable) -> Callable:
+    """
+    Cache the result of an input reader keyed on the SHA of the input file.
+
+    The same object is returned on every hit, so callers must treat it as
+    read-only (copy before modifying).
+    """
+    @functools.wraps(reader)
+    def wrapper(day: InputSource):
+        digest = file_digest(input_path(day))
+        return _cache_lookup(reader.__qualname__, digest, lambda: reader(day))
+    return wrapper
+
+def cached_parse(parse: Callable) -> Callable:
+    """
+    Cache the result of a parse function keyed on a digest of its arguments.
+
+    Used for solutions that parse the same input in both parts. As with
+    cached_reader, the returned object is shared and must not be modified.
+    """
+    @functools.wraps(parse)
+    def wrapper(*args, **kwargs):
+        payload = pickle.dumps((args, sorted(kwargs.items())), protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.sha256(payload).hexdigest()
+        name = f'{parse.__module__}.{parse.__qualname__}'
+        return _cache_lookup(name, digest, lambda: parse(*args, **kwargs))
+    return wrapper
+
+@cached_reader
+def read_lines(day: InputSource) -> list[str]:
     """Read input file for given day and return lines."""
-    with open(f'inputs/{day}.txt', 'r') as file:
+    with open(input_path(day), 'r') as file:
         return [line.strip() for line in file]
 
-def read_numbers(day: int) -> list[list[int]]:
+@cached_reader
+def read_numbers(day: InputSource) -> list[list[int]]:
     """Read input file for given day and return numbers from each line."""
-    with open(f'inputs/{day}.txt', 'r') as file:
+    with open(input_path(day), 'r') as file:
         return [[int(x) for x in line.strip().split()] for line in file]
 
-def read_chars(day: int) -> list[str]:
+@cached_reader
+def read_chars(day: InputSource) -> list[str]:
     """Read input file for the given day and return characters as a list."""
-    with open(f'inputs/{day}.txt', 'r') as file:
+    with open(input_path(day), 'r') as file:
         return list(file.read().strip())
 
-def read_char_matrix(day: int) -> list[list[str]]:
+@cached_reader
+def read_char_matrix(day: InputSource) -> list[list[str]]:
     """Read input file for given day and return matrix of chars."""
-    with open(f'inputs/{day}.txt', 'r') as file:
+    with open(input_path(day), 'r') as file:
         return [list(line.strip()) for line in file]
+
+@cached_reader
+def read_int_array(day: InputSource) -> 'np.ndarray':
+    """
+    Read a table of whitespace separated integers as a 2-D int64 array.
+
+    The file is parsed in chunks by NumPy's C reader without building
+    Python ints, so it suits inputs with millions of rows. The array is
+    shared (cached), treat it as read-only.
+    """
+    import numpy as np
+
+    return np.loadtxt(input_path(day), dtype=np.int64, ndmin=2)
+
+@cached_reader
+def read_int_rows(day: InputSource) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Read lines with varying numbers of integers into a padded array.
+
+    Numbers are parsed by NumPy in one pass over the file bytes, and the
+    count per line comes from counting token starts per line, so no Python
+    object is built per number.
+
+    Blank lines are skipped.
+
+    Returns:
+        Tuple of (an (lines, max count) int64 array padded with zeros,
+        count of numbers on every line); shared (cached), treat as read-only
+    """
+    import numpy as np
+
+    with open(input_path(day), 'rb') as file:
+        data = file.read()
+    if data and not data.endswith(b'\n'):
+        data += b'\n'
+
+    flat = np.fromstring(data, dtype=np.int64, sep=' ')
+    chars = np.frombuffer(data, dtype=np.uint8)
+    newlines = chars == ord('\n')
+    in_token = ~(newlines | (chars == ord(' ')) | (chars == ord('\t')) | (chars == ord('\r')))
+    token_start = in_token & ~np.concatenate(([False], in_token[:-1]))
+    line_of_start = np.cumsum(newlines)[token_start]
+    lengths = np.bincount(line_of_start, minlength=int(newlines.sum()))
+
+    lengths = lengths[lengths > 0]
+
+    width = int(lengths.max()) if len(lengths) else 0
+    rows = np.zeros((len(lengths), width), dtype=np.int64)
+    rows[np.arange(width) < lengths[:, None]] = flat
+    return rows, lengths
+
+def iter_lines(day: InputSource) -> Iterator[str]:
+    """Stream the lines of the input file for given day without loading it whole."""
+    with open(input_path(day), 'r') as file:
+        for line in file:
+            yield line.strip()
+
+def iter_numbers(day: InputSource) -> Iterator[list[int]]:
+    """Stream the numbers of each line of the input file for given day."""
+    for line in iter_lines(day):
+        yield [int(x) for x in line.split()]
+
+def iter_bytes(day: InputSource, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """Stream the input file for given day as chunks of at most chunk_size bytes."""
+    with open(input_path(day), 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def read_bytes(day: InputSource) -> mmap.mmap:
+    """
+    Memory-map the input file for given day (read-only).
+
+    The OS pages the file in on demand, so inputs larger than RAM can be
+    scanned, e.g. with bytes regular expressions. Close the map when done.
+    """
+    with open(input_path(day), 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+@cached_reader
+def read_grid(day: InputSource) -> 'np.ndarray':
+    """
+    Read input file for given day as a 2-D uint8 array of character codes.
+
+    The array is a zero-copy view on the file contents with the newline
+    column sliced off, so it is read-only; call .copy() to modify it.
+    Compare cells against byte values, e.g. grid == ord('#').
+    """
+    import numpy as np
+
+    with open(input_path(day), 'rb') as file:
+        data = file.read()
+    # Lines end like the first one, in '\n' or '\r\n'
+    first_end = data.find(b'\n')
+    terminator = b'\r\n' if first_end > 0 and data[first_end - 1:first_end] == b'\r' else b'\n'
+    if not data.endswith(terminator) or data.endswith(terminator * 2):
+        # Normalise the trailing newline (this copies, but only for odd files)
+        data = data.rstrip(b'\r\n') + terminator
+
+    width = data.index(b'\n')
+    stride = width + 1
+    if width and data[width - 1:width] == b'\r':
+        width -= 1
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    return buffer.reshape(-1, stride)[:, :width]
+
+def find_char(grid: 'np.ndarray', char: str) -> Tuple[int, int]:
+    """Return (row, col) of the first occurrence of char in a uint8 grid."""
+    import numpy as np
+
+    flat_index = int(np.argmax(grid == ord(char)))
+    row, col = divmod(flat_index, grid.shape[1])
+    if grid[row, col] != ord(char):
+        raise ValueError(f"{char!r} not found in grid")
+    return row, col
+
+def find_all_chars(grid: 'np.ndarray', char: str) -> 'np.ndarray':
+    """Return an (N, 2) array with (row, col) of every occurrence of char in a uint8 grid."""
+    import numpy as np
+
+    return np.argwhere(grid == ord(char))
+
+def grid_to_lines(grid: 'np.ndarray') -> list[str]:
+    """Convert a uint8 grid back to a list of strings (for printing and debugging)."""
+    return [row.tobytes().decode() for row in grid]
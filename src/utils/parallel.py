@@ -0,0 +1,116 @@
+import atexit
+import os
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    import numpy as np
+
+# Worker pool shared by all parallel solutions, created on first use
+_executor: Optional['ProcessPoolExecutor'] = None
+_executor_workers = 0
+
+# Shared memory blocks attached in this (worker) process, keyed on name
+_attached = {}
+_MAX_ATTACHED = 8
+
+def get_executor(max_workers: Optional[int] = None) -> 'ProcessPoolExecutor':
+    """
+    Return the process pool shared by all parallel solutions.
+
+    The pool is created on the first call and reused afterwards, so days
+    that run in parallel pay the worker startup only once per process.
+    Asking for more workers than the current pool has replaces it.
+
+    Args:
+        max_workers: Number of worker processes (default: os.cpu_count())
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _executor, _executor_workers
+    workers = max_workers or os.cpu_count() or 1
+    if _executor is None or workers > _executor_workers:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+@atexit.register
+def shutdown():
+    """Stop the shared pool (it is restarted by the next get_executor call)."""
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown()
+        _executor, _executor_workers = None, 0
+
+def _close(shm):
+    """Close a shared memory block, unless views on it are still alive."""
+    try:
+        shm.close()
+    except BufferError:
+        # The mapping is released once the last view is garbage collected
+        pass
+
+class SharedArray:
+    """
+    NumPy array placed in shared memory, to be passed to pool workers.
+
+    Only the handle (name, shape and dtype) is pickled into a task, and
+    workers map the same memory instead of receiving a copy of the array.
+    Create it in the parent with SharedArray.create(array), preferably as a
+    context manager so the memory is released afterwards, and call .array()
+    in the worker. Workers get a read-only view.
+    """
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self._shm = None
+
+    @classmethod
+    def create(cls, array: 'np.ndarray') -> 'SharedArray':
+        """Copy array into a new shared memory block owned by this process."""
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        shared = cls(shm.name, array.shape, array.dtype.str)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        shared._shm = shm
+        return shared
+
+    def array(self) -> 'np.ndarray':
+        """Return a read-only view on the shared array (attaching to it if needed)."""
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        shm = self._shm or _attached.get(self.name)
+        if shm is None:
+            if len(_attached) >= _MAX_ATTACHED:
+                for old in _attached.values():
+                    _close(old)
+                _attached.clear()
+            shm = shared_memory.SharedMemory(name=self.name)
+            _attached[self.name] = shm
+
+        view = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        view.flags.writeable = False
+        return view
+
+    def release(self):
+        """Free the shared memory block (owner only)."""
+        if self._shm is not None:
+            _close(self._shm)
+            self._shm.unlink()
+            self._shm = None
+
+    def __getstate__(self):
+        return {'name': self.name, 'shape': self.shape, 'dtype': self.dtype, '_shm': None}
+
+    def __enter__(self) -> 'SharedArray':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,93 @@
+import cProfile
+import io
+import pstats
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+def profile_call(func: Callable, *args, top: int = 20, sort: str = 'cumulative',
+                 dump_path: Optional[str] = None) -> Tuple[Any, str]:
+    """
+    Call func(*args) under cProfile.
+
+    Args:
+        func: Function to profile
+        top: Number of functions to include in the report
+        sort: pstats sort key ('cumulative', 'tottime', 'ncalls', ...)
+        dump_path: If given, raw stats are written there (.prof, readable by
+            pstats, snakeviz and similar tools)
+
+    Returns:
+        Tuple of the function's result and the text report
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args)
+    if dump_path:
+        profiler.dump_stats(dump_path)
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return result, report.getvalue()
+
+class HotTracer:
+    """
+    Count calls and cumulative time of functions defined in given packages.
+
+    Uses sys.setprofile, so only Python functions are seen and everything
+    else (numpy, builtins, the standard library) is skipped cheaply. Time of
+    recursive calls is attributed to the outermost active call only.
+    """
+
+    def __init__(self, prefix: str = 'src.solutions'):
+        self.prefix = prefix
+        self.calls: Dict[Tuple[str, str], int] = {}
+        self.cumulative: Dict[Tuple[str, str], float] = {}
+        self._active: Dict[Tuple[str, str], int] = {}
+        self._starts: List[Optional[Tuple[Tuple[str, str], float]]] = []
+
+    def _key(self, frame) -> Optional[Tuple[str, str]]:
+        module = frame.f_globals.get('__name__', '')
+        if not module.startswith(self.prefix):
+            return None
+        return module, frame.f_code.co_qualname
+
+    def _profile(self, frame, event, arg):
+        if event == 'call':
+            key = self._key(frame)
+            if key is None:
+                self._starts.append(None)
+                return
+            self.calls[key] = self.calls.get(key, 0) + 1
+            depth = self._active.get(key, 0)
+            self._active[key] = depth + 1
+            self._starts.append((key, time.perf_counter()) if depth == 0 else (key, None))
+        elif event == 'return' and self._starts:
+            entry = self._starts.pop()
+            if entry is None:
+                return
+            key, start = entry
+            self._active[key] -= 1
+            if start is not None:
+                self.cumulative[key] = self.cumulative.get(key, 0.0) + time.perf_counter() - start
+
+    def __enter__(self) -> 'HotTracer':
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.setprofile(None)
+
+    def report(self, top: int = 20) -> str:
+        """Format the top functions by cumulative time as a text table."""
+        header = f"{'Calls':>10} {'Cumul (s)':>10} {'Per call (us)':>14}  Function"
+        lines = [header, '-' * len(header)]
+        hottest = sorted(self.calls, key=lambda key: self.cumulative.get(key, 0.0), reverse=True)
+        for module, name in hottest[:top]:
+            calls = self.calls[(module, name)]
+            cumulative = self.cumulative.get((module, name), 0.0)
+            lines.append(
+                f"{calls:>10} {cumulative:>10.3f} {cumulative / calls * 1e6:>14.1f}  "
+                f"{module.rsplit('.', 1)[-1]}.{name}"
+            )
+        return '\n'.join(lines)
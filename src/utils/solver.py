@@ -0,0 +1,99 @@
+import importlib
+import pkgutil
+import re
+from typing import Callable, Dict, List, Optional
+
+from src.utils.input_reader import InputSource, read_lines
+
+# Modules with alternative implementations of a day, which must produce the
+# same answers. The first module of each list is the baseline.
+# Parts that fail on the real input are not registered (day15 part 2 hits
+# the recursion limit, day15_2 part 2 never terminates), so day 15 part 2 is
+# solved by day15_3 alone.
+IMPLEMENTATIONS = {
+    15: ['day15', 'day15_3', 'day15_2'],
+    17: ['day17', 'day17_solution'],
+}
+
+class Solver:
+    """
+    One implementation (variant) of a day's puzzle.
+
+    parse(source) reads the input and returns the tuple of arguments passed
+    to part1(*args) and part2(*args), so the input is parsed once for both
+    parts. A part is None if the variant does not implement it. Set
+    mutates_input when a part modifies its arguments; the runner then gives
+    each part its own copy. Variants that read the file themselves (in
+    chunks, or in parallel) use parse=lambda source: (source,), so their
+    parts get the source and all reading is timed in the parts.
+
+    Solution modules declare their variants in a module-level SOLVERS list;
+    modules without one get a single Solver built by from_module.
+    """
+
+    def __init__(self, name: str, parse: Callable[[InputSource], tuple],
+                 part1: Optional[Callable] = None, part2: Optional[Callable] = None,
+                 mutates_input: bool = False):
+        self.name = name
+        self.parse = parse
+        self.part1 = part1
+        self.part2 = part2
+        self.mutates_input = mutates_input
+
+    def part(self, part: int) -> Optional[Callable]:
+        """Return the solve function of given part (1 or 2), or None."""
+        return self.part1 if part == 1 else self.part2
+
+    @classmethod
+    def from_module(cls, name: str, module) -> 'Solver':
+        """
+        Build a Solver from the module conventions: solve_part1 / solve_part2,
+        and read_input(source) returning their arguments, or the raw input
+        lines when the module has no read_input.
+        """
+        parse = getattr(module, 'read_input', None) or (lambda source: (read_lines(source),))
+        return cls(name, parse, getattr(module, 'solve_part1', None), getattr(module, 'solve_part2', None))
+
+    def __repr__(self) -> str:
+        return f"Solver({self.name!r})"
+
+def discover_days() -> Dict[int, str]:
+    """
+    Find the solution module for every day.
+
+    Only modules named dayN / dayNN are picked up, so alternative
+    implementations like day15_2 are left alone.
+
+    Returns:
+        Dictionary mapping day number to module name
+    """
+    import src.solutions
+    days = {}
+    for module_info in pkgutil.iter_modules(src.solutions.__path__):
+        match = re.fullmatch(r'day(\d+)', module_info.name)
+        if match:
+            days[int(match.group(1))] = module_info.name
+    return dict(sorted(days.items()))
+
+def solvers_for(day: int) -> List[Solver]:
+    """
+    Return every registered variant of a day, baseline first.
+
+    Variants come from the day's module and the alternative implementation
+    modules listed in IMPLEMENTATIONS.
+    """
+    solvers = []
+    for module_name in IMPLEMENTATIONS.get(day, [discover_days()[day]]):
+        module = importlib.import_module(f'src.solutions.{module_name}')
+        solvers.extend(getattr(module, 'SOLVERS', None) or [Solver.from_module(module_name, module)])
+    return solvers
+
+def find_solver(day: int, name: Optional[str] = None) -> Solver:
+    """Return the variant of a day with given name, or the baseline if name is None."""
+    solvers = solvers_for(day)
+    if name is None:
+        return solvers[0]
+    for solver in solvers:
+        if solver.name == name:
+            return solver
+    raise KeyError(f"Day {day} has no variant {name!r} (available: {', '.join(s.name for s in solvers)})")
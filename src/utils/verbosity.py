@@ -0,0 +1,23 @@
+import os
+
+# 0 = answers only, 1 = progress and debug output of the solutions
+_verbosity: int = int(os.environ.get('AOC_VERBOSE', '0'))
+
+def set_verbosity(level: int):
+    """Set how much diagnostic output the solutions print."""
+    global _verbosity
+    _verbosity = level
+
+def is_verbose(level: int = 1) -> bool:
+    """
+    Check whether output at this level is enabled.
+
+    Guard per-item output in hot loops with this, so that the message is
+    not even formatted when running quietly.
+    """
+    return _verbosity >= level
+
+def log(*args, level: int = 1, **kwargs):
+    """Print like print(), but only when the verbosity is at least level."""
+    if _verbosity >= level:
+        print(*args, **kwargs)